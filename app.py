@@ -26,18 +26,30 @@
 import streamlit as st
 import asyncio
 import pandas as pd
-import folium
-from streamlit_folium import st_folium
-from folium.plugins import HeatMap, MarkerCluster
-from core import SentinelAgent, generate_pdf_report, run_audit, ScanMode
-from datetime import datetime, timedelta
-import plotly.graph_objects as go
-import plotly.express as px
+import streamlit.components.v1 as components
+from core import SentinelAgent, generate_pdf_report, run_audit, ScanMode, pdf_bytes, RISK_TIERS
+from reference_data import ISO_27001_CONTROLS, BSI_BAUSTEINE, NIS2_REQUIREMENTS, QUBIT_REQUIREMENTS_DF, AES_GROVER_DF
+from datetime import date, datetime, timedelta
 import numpy as np
 import json
+import hashlib
+import importlib
+import orjson
 import time
+import threading
 import math
-from fpdf import FPDF
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import folium
+
+# uvloop speeds up the recon stage's socket and DNS work where available
+try:
+    import uvloop
+    _loop_factory = uvloop.new_event_loop
+except ImportError:
+    _loop_factory = None
 
 # ============================================================================
 # PAGE CONFIG
@@ -54,8 +66,7 @@ st.set_page_config(
 # ULTIMATE CSS - DARK QUANTUM THEME
 # ============================================================================
 
-st.markdown("""
-<style>
+_CSS = """
     /* === BASE THEME === */
     .main, .stApp {
         background: linear-gradient(180deg, #0a0a12 0%, #12121f 50%, #1a1a2e 100%);
@@ -87,7 +98,12 @@ st.markdown("""
         border-radius: 20px;
         border: 1px solid rgba(255, 255, 255, 0.1);
         padding: 1.5rem;
-        transition: all 0.3s ease;
+        transform: translateZ(0);
+        will-change: transform;
+        transition: transform 0.3s ease;
+        contain: layout paint style;
+        content-visibility: auto;
+        contain-intrinsic-size: auto 200px;
     }
     
     .glass-card:hover {
@@ -142,8 +158,7 @@ st.markdown("""
         padding: 1rem;
         font-family: 'Fira Code', 'Courier New', monospace;
         font-size: 0.8rem;
-        max-height: 250px;
-        overflow-y: auto;
+        contain: layout paint style;
     }
     
     .jarvis-header {
@@ -153,6 +168,31 @@ st.markdown("""
         margin-bottom: 0.5rem;
     }
     
+    /* === STATUS ROW === */
+    .status-row, .mode-grid, .legend-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+        contain: paint;
+    }
+    .triple-grid {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 1rem;
+        contain: paint;
+    }
+    
+    /* === FRAMEWORK DETAILS === */
+    .fw-details {
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 10px;
+        padding: 0.5rem 1rem;
+        margin: 0.5rem 0;
+    }
+    .fw-details > summary {
+        cursor: pointer;
+    }
+    
     /* === METRIC BOXES === */
     .metric-box {
         background: rgba(0, 0, 0, 0.3);
@@ -160,6 +200,9 @@ st.markdown("""
         padding: 1rem;
         text-align: center;
         border: 1px solid rgba(255, 255, 255, 0.1);
+        contain: layout paint style;
+        content-visibility: auto;
+        contain-intrinsic-size: auto 100px;
     }
     
     .metric-box-critical {
@@ -232,6 +275,12 @@ st.markdown("""
         transition: width 1s ease;
     }
     
+    /* === REDUCED MOTION === */
+    @media (prefers-reduced-motion: reduce) {
+        .quantum-title, .mode-card-quantum { animation: none !important; }
+        .glass-card, .score-bar-fill { transition: none !important; }
+    }
+    
     /* === HIDE DEFAULTS === */
     #MainMenu, footer, header {visibility: hidden;}
     
@@ -245,63 +294,121 @@ st.markdown("""
     .risk-high { background: #ff8c00; color: #fff; padding: 2px 8px; border-radius: 5px; font-weight: bold; }
     .risk-medium { background: #ffd700; color: #000; padding: 2px 8px; border-radius: 5px; font-weight: bold; }
     .risk-low { background: #00f5d4; color: #000; padding: 2px 8px; border-radius: 5px; font-weight: bold; }
-</style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource(show_spinner=False)
+def _minified_css() -> str:
+    """Theme stylesheet with comments and layout whitespace stripped"""
+    css = re.sub(r"/\*.*?\*/", "", _CSS, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return f"<style>{css.strip()}</style>"
+
+st.markdown(_minified_css(), unsafe_allow_html=True)
+
+# ============================================================================
+# IMPORT PREWARM
+# ============================================================================
+
+def _import_heavy_modules():
+    """Pay the cold-import cost of the lazily imported map, chart and PDF stacks"""
+    for module in ("folium.plugins", "plotly.express", "plotly.graph_objects"):
+        importlib.import_module(module)
+    from fpdf import FPDF
+    FPDF()
+
+@st.cache_resource(show_spinner=False)
+def _prewarm_imports() -> threading.Thread:
+    """Import the heavy modules in the background once per process, so the
+    first results render doesn't stall on them"""
+    thread = threading.Thread(target=_import_heavy_modules, daemon=True)
+    thread.start()
+    return thread
+
+_prewarm_imports()
 
 # ============================================================================
 # SESSION STATE
 # ============================================================================
 
-defaults = {
-    'audit_data': None,
-    'scan_history': [],
-    'current_scan_mode': "Deep Quantum Analysis",
-    'jarvis_log': [],
-    'current_target': "",
-    'budget_settings': {
-        'consulting_rate': 150,
-        'implementation_months': 12,
-        'team_size': 3,
-        'include_training': True,
-        'include_certification': True
+CRQC_YEAR = 2030
+CRQC_LABEL = "CRQC Expected"
+
+def _ensure_state():
+    """Seed session defaults on a session's first run; later reruns skip it"""
+    if '_state_ready' in st.session_state:
+        return
+    defaults = {
+        'audit_data': None,
+        'audit_frames': None,
+        'scan_history': [],
+        'current_scan_mode': "Deep Quantum Analysis",
+        'jarvis_log': [],
+        'current_target': "",
+        'animations_enabled': True,
+        'budget_settings': {
+            'consulting_rate': 150,
+            'implementation_months': 12,
+            'team_size': 3,
+            'include_training': True,
+            'include_certification': True
+        }
     }
-}
+    for key, value in defaults.items():
+        st.session_state.setdefault(key, value)
+    st.session_state._state_ready = True
+
+_ensure_state()
 
-for key, value in defaults.items():
-    if key not in st.session_state:
-        st.session_state[key] = value
+# The CRQC countdown only moves once a year; a day-long TTL keeps long-lived
+# processes correct across New Year without touching the clock every rerun
+@st.cache_data(ttl=86400, show_spinner=False)
+def _years_until_crqc() -> int:
+    return max(0, CRQC_YEAR - date.today().year)
 
 # ============================================================================
 # JARVIS SYSTEM
 # ============================================================================
 
+# Fixed-height terminal: only the newest lines are rendered, so it never scrolls
+JARVIS_VISIBLE_LINES = 8
+
+def _clock() -> str:
+    """Local wall-clock time as HH:MM:SS.cc, without datetime/strftime"""
+    now = time.time()
+    # Offset looked up per call so DST changes apply to a long-running server
+    t = now + time.localtime(now).tm_gmtoff
+    s = int(t)
+    return f"{(s // 3600) % 24:02d}:{(s // 60) % 60:02d}:{s % 60:02d}.{int((t - s) * 100):02d}"
+
+JARVIS_COLORS = {
+    "INFO": "#00ff00", "WARN": "#ffff00", "ERROR": "#ff4444",
+    "QUANTUM": "#c77dff", "SUCCESS": "#00f5d4", "STEALTH": "#ff4444",
+    "SYSTEM": "#00ffff", "SCAN": "#4361ee"
+}
+
+JARVIS_HEADER_HTML = """<div class='jarvis-terminal'>
+    <div class='jarvis-header'>⚡ JARVIS v3.0 | Quantum Intelligence System | ProSec Networks</div>"""
+JARVIS_IDLE_HTML = "<div style='color:#00ff00;'>$ Awaiting commands, Thokio...</div>"
+
 def jarvis(msg: str, level: str = "INFO"):
-    """Add to JARVIS log"""
-    colors = {
-        "INFO": "#00ff00", "WARN": "#ffff00", "ERROR": "#ff4444",
-        "QUANTUM": "#c77dff", "SUCCESS": "#00f5d4", "STEALTH": "#ff4444",
-        "SYSTEM": "#00ffff", "SCAN": "#4361ee"
-    }
+    """Add to JARVIS log; each line is rendered to HTML once, when logged"""
+    color = JARVIS_COLORS.get(level, "#00ff00")
+    t = _clock()
     st.session_state.jarvis_log.append({
-        "time": datetime.now().strftime("%H:%M:%S.%f")[:-4],
-        "msg": msg, "level": level, "color": colors.get(level, "#00ff00")
+        "time": t, "msg": msg, "level": level, "color": color,
+        "html": f"<div style='margin: 3px 0;'><span style='color:#666;'>[{t}]</span> <span style='color:{color};'>[{level}]</span> {msg}</div>"
     })
     if len(st.session_state.jarvis_log) > 30:
         st.session_state.jarvis_log = st.session_state.jarvis_log[-30:]
 
 def render_jarvis():
-    """Render JARVIS terminal"""
-    html = """<div class='jarvis-terminal'>
-    <div class='jarvis-header'>⚡ JARVIS v3.0 | Quantum Intelligence System | ProSec Networks</div>"""
-    
-    for log in st.session_state.jarvis_log[-12:]:
-        html += f"<div style='margin: 3px 0;'><span style='color:#666;'>[{log['time']}]</span> <span style='color:{log['color']};'>[{log['level']}]</span> {log['msg']}</div>"
-    
-    if not st.session_state.jarvis_log:
-        html += "<div style='color:#00ff00;'>$ Awaiting commands, Thokio...</div>"
-    
-    html += "</div>"
-    return html
+    """Render JARVIS terminal from the pre-rendered log lines"""
+    log = st.session_state.jarvis_log
+    if not log:
+        return JARVIS_HEADER_HTML + JARVIS_IDLE_HTML + "</div>"
+    return JARVIS_HEADER_HTML + "".join(entry['html'] for entry in log[-JARVIS_VISIBLE_LINES:]) + "</div>"
 
 # ============================================================================
 # MODE CONFIGURATIONS
@@ -379,215 +486,153 @@ MODES = {
     }
 }
 
-# ============================================================================
-# ISO 27001 CONTROLS DATABASE
-# ============================================================================
+# Per-mode presentation is resolved once here, so render code only does lookups
+for _name, _info in MODES.items():
+    _info["jarvis_level"] = "QUANTUM" if "Quantum" in _name else "SCAN"
+    _info["views"] = ["📊 Intelligence"]
+    if _info["specs"]["quantum"]:
+        _info["views"] += ["⚛️ Shor's Algorithm", "🔍 Grover's Algorithm"]
+    _info["views"].append("🗺️ Threat Radar")
+    if _name == "Comprehensive Audit":
+        _info["views"] += ["📋 ISMS Framework", "💰 Budget Calculator"]
+    _info["views"].append("📥 Export")
 
-ISO_27001_CONTROLS = {
-    "A.5": {
-        "name": "Information Security Policies",
-        "controls": [
-            {"id": "A.5.1", "name": "Policies for information security", 
-             "description": "A set of policies for information security shall be defined, approved by management, published and communicated to employees and relevant external parties.",
-             "quantum_impact": "HIGH",
-             "quantum_requirement": "Include Post-Quantum Cryptography (PQC) migration policy. Define timeline for transitioning to NIST-approved quantum-resistant algorithms.",
-             "implementation": "1. Draft quantum security policy\n2. Define PQC migration timeline\n3. Establish governance structure\n4. Communicate to all stakeholders"},
-        ]
-    },
-    "A.6": {
-        "name": "Organization of Information Security",
-        "controls": [
-            {"id": "A.6.1", "name": "Internal organization",
-             "description": "A management framework shall be established to initiate and control the implementation and operation of information security.",
-             "quantum_impact": "MEDIUM",
-             "quantum_requirement": "Assign quantum security responsibilities. Designate PQC migration lead.",
-             "implementation": "1. Appoint quantum security officer\n2. Define reporting structure\n3. Establish review cadence"},
-        ]
-    },
-    "A.8": {
-        "name": "Asset Management",
-        "controls": [
-            {"id": "A.8.1", "name": "Responsibility for assets",
-             "description": "Assets associated with information and information processing facilities shall be identified and an inventory maintained.",
-             "quantum_impact": "CRITICAL",
-             "quantum_requirement": "Maintain inventory of ALL cryptographic assets. Tag each with quantum vulnerability status and migration priority.",
-             "implementation": "1. Inventory all crypto assets\n2. Classify by quantum risk\n3. Tag migration priority\n4. Monitor continuously"},
-            {"id": "A.8.2", "name": "Information classification",
-             "description": "Information shall be classified in terms of legal requirements, value, criticality and sensitivity.",
-             "quantum_impact": "HIGH",
-             "quantum_requirement": "Add 'Quantum Sensitivity' classification. Data with >10yr confidentiality requirement needs immediate PQC.",
-             "implementation": "1. Add quantum classification tier\n2. Identify long-lived data\n3. Prioritize HNDL-vulnerable data"},
-        ]
-    },
-    "A.10": {
-        "name": "Cryptographic Controls",
-        "controls": [
-            {"id": "A.10.1", "name": "Cryptographic controls",
-             "description": "A policy on the use of cryptographic controls for protection of information shall be developed and implemented.",
-             "quantum_impact": "CRITICAL",
-             "quantum_requirement": "URGENT: Migrate to NIST PQC standards. Implement ML-KEM (FIPS 203) for key exchange, ML-DSA (FIPS 204) for signatures, SLH-DSA (FIPS 205) for stateless signatures.",
-             "implementation": "1. Audit current cryptography\n2. Select PQC algorithms\n3. Implement hybrid mode\n4. Test thoroughly\n5. Full migration"},
-        ]
-    },
-    "A.12": {
-        "name": "Operations Security",
-        "controls": [
-            {"id": "A.12.4", "name": "Logging and monitoring",
-             "description": "Event logs recording user activities, exceptions, faults and information security events shall be produced, kept and regularly reviewed.",
-             "quantum_impact": "HIGH",
-             "quantum_requirement": "Monitor for quantum-related threats. Detect potential HNDL (Harvest Now, Decrypt Later) attacks - unusual data exfiltration patterns.",
-             "implementation": "1. Add quantum threat signatures to SIEM\n2. Monitor large data transfers\n3. Alert on crypto anomalies"},
-        ]
-    },
-    "A.13": {
-        "name": "Communications Security",
-        "controls": [
-            {"id": "A.13.1", "name": "Network security management",
-             "description": "Networks shall be managed and controlled to protect information in systems and applications.",
-             "quantum_impact": "CRITICAL",
-             "quantum_requirement": "Deploy quantum-safe TLS. Implement hybrid classical-PQC cipher suites during transition.",
-             "implementation": "1. Upgrade TLS libraries\n2. Enable PQC cipher suites\n3. Test interoperability\n4. Monitor performance"},
-        ]
-    },
-    "A.14": {
-        "name": "System Development Security",
-        "controls": [
-            {"id": "A.14.2", "name": "Security in development processes",
-             "description": "Rules for the development of software and systems shall be established and applied.",
-             "quantum_impact": "HIGH",
-             "quantum_requirement": "Integrate cryptographic agility into SDL. All new systems must support algorithm switching without code changes.",
-             "implementation": "1. Update coding standards\n2. Require crypto abstraction layers\n3. Add PQC to security testing"},
-        ]
-    },
-    "A.16": {
-        "name": "Incident Management",
-        "controls": [
-            {"id": "A.16.1", "name": "Management of incidents",
-             "description": "Responsibilities and procedures shall be established to ensure a quick, effective and orderly response to incidents.",
-             "quantum_impact": "HIGH",
-             "quantum_requirement": "Develop quantum incident response playbooks. Define procedures for discovered HNDL attacks and crypto compromises.",
-             "implementation": "1. Create quantum IR playbook\n2. Define escalation paths\n3. Establish notification procedures\n4. Practice tabletop exercises"},
-        ]
-    },
-    "A.18": {
-        "name": "Compliance",
-        "controls": [
-            {"id": "A.18.1", "name": "Compliance with legal requirements",
-             "description": "All relevant statutory, regulatory and contractual requirements shall be identified, documented and kept up to date.",
-             "quantum_impact": "CRITICAL",
-             "quantum_requirement": "Monitor quantum-related regulations. NIS2 (EU), NIST guidelines (US), BSI recommendations (DE) all increasingly require quantum readiness.",
-             "implementation": "1. Track regulatory developments\n2. Map to compliance calendar\n3. Ensure audit readiness"},
-        ]
-    }
+# Welcome-screen cards depend only on MODES, so the markup is assembled here
+# and the page emits the whole grid in one element
+MODE_CARD_HTML = {
+    name: (
+        f"<div style='background:{info['gradient']}; padding:1.5rem; border-radius:15px; height:220px;'>"
+        f"<h2 style='margin:0;'>{info['icon']}</h2>"
+        f"<h4 style='margin:0.5rem 0; color:{info['text_color']};'>{name}</h4>"
+        f"<p style='font-size:0.8rem; color:{info['text_color']}; opacity:0.8;'>{info['tagline']}</p>"
+        f"</div>"
+    )
+    for name, info in MODES.items()
 }
+MODE_GRID_HTML = "<div class='mode-grid'>" + "".join(MODE_CARD_HTML.values()) + "</div>"
 
-# ============================================================================
-# BSI IT-GRUNDSCHUTZ DATABASE
-# ============================================================================
+# Shared Plotly styling: dark template on a transparent canvas
+DARK_LAYOUT = dict(template="plotly_dark", paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
 
-BSI_BAUSTEINE = {
-    "ISMS": [
-        {"id": "ISMS.1", "name": "Sicherheitsmanagement",
-         "description": "Establishes the foundation for information security management system.",
-         "quantum_req": "Integrate quantum risk into enterprise risk management. Assign quantum security responsibilities.",
-         "priority": "P0"},
-    ],
-    "CON": [
-        {"id": "CON.1", "name": "Kryptokonzept",
-         "description": "Cryptographic concept defining all cryptographic mechanisms used.",
-         "quantum_req": "CRITICAL: Define PQC transition strategy. Document current crypto inventory. Plan migration to ML-KEM (FIPS 203), ML-DSA (FIPS 204), SLH-DSA (FIPS 205).",
-         "priority": "P0"},
-        {"id": "CON.7", "name": "Informationssicherheit auf Reisen",
-         "description": "Security for mobile work and travel.",
-         "quantum_req": "Ensure VPN uses quantum-safe protocols. Protect mobile devices with PQC-enabled encryption.",
-         "priority": "P1"},
-    ],
-    "OPS": [
-        {"id": "OPS.1.1.2", "name": "Ordnungsgemäße IT-Administration",
-         "description": "Proper IT administration procedures.",
-         "quantum_req": "Include PQC updates in patch management. Prioritize crypto library updates.",
-         "priority": "P1"},
-        {"id": "OPS.1.1.3", "name": "Patch- und Änderungsmanagement",
-         "description": "Patch and change management.",
-         "quantum_req": "Establish expedited patching for quantum-related vulnerabilities. Track NIST PQC updates.",
-         "priority": "P0"},
-    ],
-    "DER": [
-        {"id": "DER.1", "name": "Detektion von sicherheitsrelevanten Ereignissen",
-         "description": "Detection of security-relevant events.",
-         "quantum_req": "Add HNDL attack signatures to detection rules. Monitor for unusual encrypted data exfiltration.",
-         "priority": "P0"},
-        {"id": "DER.2.1", "name": "Behandlung von Sicherheitsvorfällen",
-         "description": "Security incident handling.",
-         "quantum_req": "Develop quantum-specific incident response procedures. Include crypto compromise scenarios.",
-         "priority": "P0"},
-    ],
-    "NET": [
-        {"id": "NET.1.1", "name": "Netzarchitektur und -design",
-         "description": "Network architecture and design.",
-         "quantum_req": "Design for cryptographic agility. Enable seamless algorithm transitions.",
-         "priority": "P1"},
-        {"id": "NET.3.3", "name": "VPN",
-         "description": "Virtual Private Networks.",
-         "quantum_req": "CRITICAL: Deploy quantum-safe VPN. Implement hybrid classical-PQC mode immediately.",
-         "priority": "P0"},
-    ]
-}
+@st.cache_resource(show_spinner=False)
+def _timeline_fig():
+    """Welcome-screen quantum threat timeline; every input is a constant"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    years = list(range(2024, 2036))
+    threat = [10 + (i**2)/3 for i in range(len(years))]
+    threat = [min(100, t) for t in threat]
+    
+    fig.add_trace(go.Scattergl(x=years, y=threat, fill='tozeroy', 
+        line=dict(color='#9d4edd', width=3), fillcolor='rgba(157,78,221,0.2)'))
+    fig.add_vline(x=CRQC_YEAR, line_dash="dash", line_color="#ff4444", annotation_text="CRQC")
+    fig.update_layout(**DARK_LAYOUT, height=300, xaxis_title="Year", yaxis_title="Threat %")
+    return fig
 
 # ============================================================================
-# NIS2 ARTICLE 21 DATABASE
+# SHOR'S ALGORITHM DEEP DIVE
 # ============================================================================
 
-NIS2_REQUIREMENTS = [
-    {"article": "21(2)(a)", "name": "Risk analysis and security policies",
-     "description": "Policies on risk analysis and information system security.",
-     "quantum_gap": "Must include quantum computing in risk analysis. PQC migration policy required.",
-     "status": "CRITICAL", "priority": "P0"},
-    {"article": "21(2)(b)", "name": "Incident handling",
-     "description": "Procedures for handling security incidents.",
-     "quantum_gap": "Quantum incident response procedures needed. HNDL attack playbook required.",
-     "status": "REQUIRED", "priority": "P0"},
-    {"article": "21(2)(c)", "name": "Business continuity",
-     "description": "Business continuity including backup management, disaster recovery, and crisis management.",
-     "quantum_gap": "Include quantum threats in BCM scenarios. Crypto-apocalypse scenario planning.",
-     "status": "REQUIRED", "priority": "P1"},
-    {"article": "21(2)(d)", "name": "Supply chain security",
-     "description": "Security relating to acquisition, development and maintenance of systems.",
-     "quantum_gap": "Assess supplier quantum readiness. Include PQC requirements in procurement.",
-     "status": "REQUIRED", "priority": "P1"},
-    {"article": "21(2)(e)", "name": "Security in network and systems acquisition",
-     "description": "Security in network and information systems acquisition, development and maintenance.",
-     "quantum_gap": "Mandate cryptographic agility in new systems. Require PQC capability.",
-     "status": "REQUIRED", "priority": "P1"},
-    {"article": "21(2)(f)", "name": "Vulnerability handling and disclosure",
-     "description": "Policies and procedures for assessing effectiveness of cybersecurity measures.",
-     "quantum_gap": "Include quantum vulnerabilities in assessment scope. Track CVEs related to crypto.",
-     "status": "CRITICAL", "priority": "P0"},
-    {"article": "21(2)(g)", "name": "Cybersecurity training",
-     "description": "Basic cyber hygiene practices and cybersecurity training.",
-     "quantum_gap": "Add quantum awareness training. Educate staff on HNDL threats.",
-     "status": "RECOMMENDED", "priority": "P2"},
-    {"article": "21(2)(h)", "name": "Cryptography",
-     "description": "Policies and procedures regarding the use of cryptography and encryption.",
-     "quantum_gap": "CRITICAL: Explicit PQC migration plan required. NIST FIPS 203/204/205 implementation.",
-     "status": "CRITICAL", "priority": "P0"},
-    {"article": "21(2)(i)", "name": "Human resources security",
-     "description": "Human resources security, access control policies and asset management.",
-     "quantum_gap": "Include quantum in security awareness. Update access controls for PQC.",
-     "status": "REQUIRED", "priority": "P1"},
-    {"article": "21(2)(j)", "name": "Multi-factor authentication",
-     "description": "Use of MFA, secured communications and emergency communication systems.",
-     "quantum_gap": "Plan for quantum-safe MFA. Current TOTP/HOTP may need updates.",
-     "status": "REQUIRED", "priority": "P1"},
-]
+# Static Shor explainer cards, emitted as one three-column grid
+SHOR_STEPS_HTML = """
+<div class='triple-grid'>
+    <div class='glass-card'>
+        <h4 style='color: #00f5d4;'>Step 1: Quantum Superposition</h4>
+        <p>Prepare qubits in superposition state:</p>
+        <p style='font-family: monospace; color: #c77dff;'>|ψ⟩ = (1/√N) Σ|x⟩</p>
+        <p>This allows evaluating f(x) = aˣ mod N for ALL x simultaneously.</p>
+    </div>
+    <div class='glass-card'>
+        <h4 style='color: #9d4edd;'>Step 2: Quantum Fourier Transform</h4>
+        <p>Apply QFT to find the period r of:</p>
+        <p style='font-family: monospace; color: #c77dff;'>f(x) = aˣ mod N</p>
+        <p>QFT extracts frequency information from quantum states.</p>
+    </div>
+    <div class='glass-card'>
+        <h4 style='color: #f72585;'>Step 3: Factor Extraction</h4>
+        <p>With period r, compute factors:</p>
+        <p style='font-family: monospace; color: #c77dff;'>GCD(a^(r/2) ± 1, N)</p>
+        <p>High probability of yielding non-trivial factors.</p>
+    </div>
+</div>
+"""
 
-# ============================================================================
-# SHOR'S ALGORITHM DEEP DIVE
-# ============================================================================
+# Countdown cards; only the CRQC year count varies
+SHOR_COUNTDOWN_HTML = """
+<div class='triple-grid'>
+    <div style='background: linear-gradient(135deg, #ff4444 0%, #cc0000 100%); 
+                padding: 2rem; border-radius: 15px; text-align: center;'>
+        <h1 style='margin: 0; color: white; font-size: 4rem;'>{years_left}</h1>
+        <p style='margin: 0; color: rgba(255,255,255,0.9); font-size: 1.2rem;'>Years Until CRQC</p>
+        <p style='margin: 0.5rem 0 0 0; color: rgba(255,255,255,0.7);'>Cryptographically Relevant Quantum Computer</p>
+    </div>
+    <div style='background: linear-gradient(135deg, #ff8c00 0%, #e65100 100%); 
+                padding: 2rem; border-radius: 15px; text-align: center;'>
+        <h1 style='margin: 0; color: white; font-size: 4rem;'>NOW</h1>
+        <p style='margin: 0; color: rgba(255,255,255,0.9); font-size: 1.2rem;'>HNDL Threat Active</p>
+        <p style='margin: 0.5rem 0 0 0; color: rgba(255,255,255,0.7);'>Harvest Now, Decrypt Later attacks happening TODAY</p>
+    </div>
+    <div style='background: linear-gradient(135deg, #7b2cbf 0%, #9d4edd 100%); 
+                padding: 2rem; border-radius: 15px; text-align: center;'>
+        <h1 style='margin: 0; color: white; font-size: 4rem;'>2024</h1>
+        <p style='margin: 0; color: rgba(255,255,255,0.9); font-size: 1.2rem;'>NIST PQC Finalized</p>
+        <p style='margin: 0.5rem 0 0 0; color: rgba(255,255,255,0.7);'>ML-KEM, ML-DSA, SLH-DSA now standardized</p>
+    </div>
+</div>
+"""
+
+@st.cache_resource(show_spinner=False)
+def _shor_vulnerability_fig():
+    """RSA/ECC/AES vulnerability curves; every input is a constant"""
+    import plotly.graph_objects as go
+    
+    years = np.arange(2024, 2041)
+    i = np.arange(len(years), dtype=np.float64)
+    
+    # RSA/ECC vulnerability curves, capped at certainty; AES only halves under Grover
+    rsa_2048 = np.minimum(5 + i**2.2 / 15, 100.0)
+    rsa_4096 = np.minimum(2 + i**2.0 / 20, 100.0)
+    ecc_256 = np.minimum(8 + i**2.3 / 12, 100.0)
+    aes_256 = np.minimum(1 + i * 2.5, 70.0)
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scattergl(x=years, y=rsa_2048, name='RSA-2048',
+        line=dict(color='#ff4444', width=3), fill='tozeroy',
+        fillcolor='rgba(255, 68, 68, 0.1)'))
+    
+    fig.add_trace(go.Scattergl(x=years, y=ecc_256, name='ECC-256',
+        line=dict(color='#ff8c00', width=3)))
+    
+    fig.add_trace(go.Scattergl(x=years, y=rsa_4096, name='RSA-4096',
+        line=dict(color='#ffd700', width=3, dash='dash')))
+    
+    fig.add_trace(go.Scattergl(x=years, y=aes_256, name='AES-256 (Grover)',
+        line=dict(color='#00f5d4', width=3, dash='dot')))
+    
+    # CRQC line
+    fig.add_vline(x=CRQC_YEAR, line_dash="dash", line_color="#c77dff",
+        annotation_text=CRQC_LABEL, annotation_position="top left")
+    
+    # Critical threshold
+    fig.add_hline(y=75, line_dash="dot", line_color="#ff4444",
+        annotation_text="Critical Threshold (75%)")
+    
+    fig.update_layout(
+        **DARK_LAYOUT,
+        height=450,
+        xaxis_title="Year",
+        yaxis_title="Vulnerability Probability (%)",
+        legend=dict(x=0.02, y=0.98),
+        font=dict(color='white'),
+        yaxis=dict(range=[0, 105])
+    )
+    
+    return fig
 
 def render_shors_deep_dive(df: pd.DataFrame):
     """Complete Shor's Algorithm analysis with math and visualizations"""
-    
     st.markdown("## ⚛️ Shor's Algorithm: The Quantum Threat Explained")
     
     # Introduction
@@ -607,57 +652,7 @@ def render_shors_deep_dive(df: pd.DataFrame):
     with col1:
         st.markdown("### 📊 Cryptographic Vulnerability Timeline")
         
-        years = list(range(2024, 2041))
-        
-        # RSA vulnerability curves
-        rsa_2048 = [5 + (i**2.2)/15 for i in range(len(years))]
-        rsa_2048 = [min(100, v) for v in rsa_2048]
-        
-        rsa_4096 = [2 + (i**2.0)/20 for i in range(len(years))]
-        rsa_4096 = [min(100, v) for v in rsa_4096]
-        
-        ecc_256 = [8 + (i**2.3)/12 for i in range(len(years))]
-        ecc_256 = [min(100, v) for v in ecc_256]
-        
-        aes_256 = [1 + i*2.5 for i in range(len(years))]
-        aes_256 = [min(70, v) for v in aes_256]
-        
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(x=years, y=rsa_2048, name='RSA-2048',
-            line=dict(color='#ff4444', width=3), fill='tozeroy',
-            fillcolor='rgba(255, 68, 68, 0.1)'))
-        
-        fig.add_trace(go.Scatter(x=years, y=ecc_256, name='ECC-256',
-            line=dict(color='#ff8c00', width=3)))
-        
-        fig.add_trace(go.Scatter(x=years, y=rsa_4096, name='RSA-4096',
-            line=dict(color='#ffd700', width=3, dash='dash')))
-        
-        fig.add_trace(go.Scatter(x=years, y=aes_256, name='AES-256 (Grover)',
-            line=dict(color='#00f5d4', width=3, dash='dot')))
-        
-        # CRQC line
-        fig.add_vline(x=2030, line_dash="dash", line_color="#c77dff",
-            annotation_text="CRQC Expected", annotation_position="top left")
-        
-        # Critical threshold
-        fig.add_hline(y=75, line_dash="dot", line_color="#ff4444",
-            annotation_text="Critical Threshold (75%)")
-        
-        fig.update_layout(
-            template="plotly_dark",
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            height=450,
-            xaxis_title="Year",
-            yaxis_title="Vulnerability Probability (%)",
-            legend=dict(x=0.02, y=0.98),
-            font=dict(color='white'),
-            yaxis=dict(range=[0, 105])
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_shor_vulnerability_fig(), use_container_width=True)
     
     with col2:
         st.markdown("### 🧮 The Mathematics")
@@ -683,89 +678,18 @@ def render_shors_deep_dive(df: pd.DataFrame):
         
         st.markdown("### ⚡ Qubit Requirements")
         
-        qubit_data = {
-            "Algorithm": ["RSA-2048", "RSA-4096", "ECC-256", "ECC-384"],
-            "Logical Qubits": ["4,099", "8,194", "2,330", "3,484"],
-            "Physical Qubits*": ["~20M", "~40M", "~12M", "~17M"],
-            "Est. Break Time": ["8 hours", "24 hours", "4 hours", "8 hours"]
-        }
-        
-        st.dataframe(pd.DataFrame(qubit_data), hide_index=True, use_container_width=True)
+        st.dataframe(QUBIT_REQUIREMENTS_DF, hide_index=True, use_container_width=True)
         st.caption("*With current error correction overhead (~5000:1)")
     
     st.markdown("---")
     
     # How it works
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <div class='glass-card'>
-            <h4 style='color: #00f5d4;'>Step 1: Quantum Superposition</h4>
-            <p>Prepare qubits in superposition state:</p>
-            <p style='font-family: monospace; color: #c77dff;'>|ψ⟩ = (1/√N) Σ|x⟩</p>
-            <p>This allows evaluating f(x) = aˣ mod N for ALL x simultaneously.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div class='glass-card'>
-            <h4 style='color: #9d4edd;'>Step 2: Quantum Fourier Transform</h4>
-            <p>Apply QFT to find the period r of:</p>
-            <p style='font-family: monospace; color: #c77dff;'>f(x) = aˣ mod N</p>
-            <p>QFT extracts frequency information from quantum states.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div class='glass-card'>
-            <h4 style='color: #f72585;'>Step 3: Factor Extraction</h4>
-            <p>With period r, compute factors:</p>
-            <p style='font-family: monospace; color: #c77dff;'>GCD(a^(r/2) ± 1, N)</p>
-            <p>High probability of yielding non-trivial factors.</p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(SHOR_STEPS_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
     # Threat countdown
-    current_year = datetime.now().year
-    crqc_year = 2030
-    years_left = crqc_year - current_year
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown(f"""
-        <div style='background: linear-gradient(135deg, #ff4444 0%, #cc0000 100%); 
-                    padding: 2rem; border-radius: 15px; text-align: center;'>
-            <h1 style='margin: 0; color: white; font-size: 4rem;'>{years_left}</h1>
-            <p style='margin: 0; color: rgba(255,255,255,0.9); font-size: 1.2rem;'>Years Until CRQC</p>
-            <p style='margin: 0.5rem 0 0 0; color: rgba(255,255,255,0.7);'>Cryptographically Relevant Quantum Computer</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #ff8c00 0%, #e65100 100%); 
-                    padding: 2rem; border-radius: 15px; text-align: center;'>
-            <h1 style='margin: 0; color: white; font-size: 4rem;'>NOW</h1>
-            <p style='margin: 0; color: rgba(255,255,255,0.9); font-size: 1.2rem;'>HNDL Threat Active</p>
-            <p style='margin: 0.5rem 0 0 0; color: rgba(255,255,255,0.7);'>Harvest Now, Decrypt Later attacks happening TODAY</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <div style='background: linear-gradient(135deg, #7b2cbf 0%, #9d4edd 100%); 
-                    padding: 2rem; border-radius: 15px; text-align: center;'>
-            <h1 style='margin: 0; color: white; font-size: 4rem;'>2024</h1>
-            <p style='margin: 0; color: rgba(255,255,255,0.9); font-size: 1.2rem;'>NIST PQC Finalized</p>
-            <p style='margin: 0.5rem 0 0 0; color: rgba(255,255,255,0.7);'>ML-KEM, ML-DSA, SLH-DSA now standardized</p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(SHOR_COUNTDOWN_HTML.format(years_left=_years_until_crqc()), unsafe_allow_html=True)
 
 # ============================================================================
 # GROVER'S ALGORITHM
@@ -784,35 +708,9 @@ def render_grovers_analysis():
             <h4 style='color: #00f5d4;'>What is Grover's Algorithm?</h4>
             <p>Grover's algorithm provides a <strong>quadratic speedup</strong> for unstructured search problems. 
             While not as devastating as Shor's, it effectively halves the security of symmetric encryption.</p>
-            
-            <table style='width: 100%; margin-top: 1rem;'>
-                <tr style='border-bottom: 1px solid #333;'>
-                    <th style='text-align: left; padding: 0.5rem;'>Algorithm</th>
-                    <th style='text-align: left; padding: 0.5rem;'>Classical Security</th>
-                    <th style='text-align: left; padding: 0.5rem;'>Post-Quantum Security</th>
-                    <th style='text-align: left; padding: 0.5rem;'>Status</th>
-                </tr>
-                <tr>
-                    <td style='padding: 0.5rem;'>AES-128</td>
-                    <td style='padding: 0.5rem;'>128 bits</td>
-                    <td style='padding: 0.5rem; color: #ff4444;'>64 bits ❌</td>
-                    <td style='padding: 0.5rem;'><span class='risk-critical'>INSECURE</span></td>
-                </tr>
-                <tr>
-                    <td style='padding: 0.5rem;'>AES-192</td>
-                    <td style='padding: 0.5rem;'>192 bits</td>
-                    <td style='padding: 0.5rem; color: #ffd700;'>96 bits ⚠️</td>
-                    <td style='padding: 0.5rem;'><span class='risk-medium'>MARGINAL</span></td>
-                </tr>
-                <tr>
-                    <td style='padding: 0.5rem;'>AES-256</td>
-                    <td style='padding: 0.5rem;'>256 bits</td>
-                    <td style='padding: 0.5rem; color: #00f5d4;'>128 bits ✅</td>
-                    <td style='padding: 0.5rem;'><span class='risk-low'>SECURE</span></td>
-                </tr>
-            </table>
         </div>
         """, unsafe_allow_html=True)
+        st.dataframe(AES_GROVER_DF, use_container_width=True)
     
     with col2:
         st.markdown("""
@@ -832,9 +730,37 @@ def render_grovers_analysis():
 # BUDGET CALCULATOR
 # ============================================================================
 
+# ROI metric card, filled per column with str.format_map
+_ROI_CARD_HTML = """
+<div class='metric-box {variant}'>
+    <p style='margin: 0; color: #888;'>{label}</p>
+    <h2 style='margin: 0; color: {color};'>{value}</h2>
+    <p style='margin: 0; font-size: 0.8rem;'>{note}</p>
+</div>
+"""
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _budget_pie(labels: tuple, values: tuple):
+    """Budget split donut; slider positions repeat, so figures are reused"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[go.Pie(
+        labels=list(labels),
+        values=list(values),
+        hole=0.4,
+        marker=dict(colors=['#7b2cbf', '#00f5d4', '#f9a825', '#ff4444', '#4361ee', '#00bbf9'])
+    )])
+    
+    fig.update_layout(
+        **DARK_LAYOUT,
+        height=300,
+        showlegend=True,
+        legend=dict(x=1.05, y=0.5)
+    )
+    return fig
+
 def render_budget_calculator(df: pd.DataFrame, target: str):
     """Interactive budget calculator with ROI analysis"""
-    
     st.markdown("## 💰 PQC Migration Budget Calculator")
     
     col1, col2 = st.columns([1, 2])
@@ -843,8 +769,8 @@ def render_budget_calculator(df: pd.DataFrame, target: str):
         st.markdown("### ⚙️ Configuration")
         
         total_assets = len(df)
-        critical = len(df[df['Quantum_Risk'].str.contains('Critical', na=False)])
-        high = len(df[df['Quantum_Risk'].str.contains('High', na=False)])
+        counts = _risk_counts(df)
+        critical, high = counts['Critical'], counts['High']
         
         st.markdown(f"**Assets Discovered:** {total_assets}")
         st.markdown(f"**Critical Priority:** {critical}")
@@ -866,19 +792,27 @@ def render_budget_calculator(df: pd.DataFrame, target: str):
         
         # Calculate costs
         consulting_days = impl_months * 10  # 10 days/month avg
-        consulting_cost = consulting_days * consulting_rate
-        
         per_asset_cost = 2500 if critical > 10 else 2000
-        migration_cost = total_assets * per_asset_cost
         
-        training_cost = team_size * 5000 if include_training else 0
-        cert_cost = 35000 if include_cert else 0
-        tools_cost = 50000 if include_tools else 0
-        hardware_cost = (critical * 5000 + high * 2000) if include_hardware else 0
+        # Quantities x unit rates in one vector op; toggled-off items zero out
+        quantities = np.array([
+            consulting_days,
+            total_assets,
+            team_size * include_training,
+            include_cert,
+            include_tools,
+            critical * include_hardware,
+            high * include_hardware,
+        ], dtype=np.int64)
+        rates = np.array([consulting_rate, per_asset_cost, 5000, 35000, 50000, 5000, 2000], dtype=np.int64)
+        components = quantities * rates
+        
+        consulting_cost, migration_cost, training_cost, cert_cost, tools_cost = components[:5].tolist()
+        hardware_cost = int(components[5:].sum())
         
         annual_maintenance = (migration_cost + tools_cost) * 0.15
         
-        total_cost = consulting_cost + migration_cost + training_cost + cert_cost + tools_cost + hardware_cost
+        total_cost = int(components.sum())
         
         # Display breakdown
         budget_items = [
@@ -890,28 +824,16 @@ def render_budget_calculator(df: pd.DataFrame, target: str):
             ("Hardware Upgrades", hardware_cost, "HSMs, accelerators"),
         ]
         
-        fig = go.Figure(data=[go.Pie(
-            labels=[item[0] for item in budget_items if item[1] > 0],
-            values=[item[1] for item in budget_items if item[1] > 0],
-            hole=0.4,
-            marker=dict(colors=['#7b2cbf', '#00f5d4', '#f9a825', '#ff4444', '#4361ee', '#00bbf9'])
-        )])
-        
-        fig.update_layout(
-            template="plotly_dark",
-            paper_bgcolor='rgba(0,0,0,0)',
-            height=300,
-            showlegend=True,
-            legend=dict(x=1.05, y=0.5)
-        )
-        
+        shown = [item for item in budget_items if item[1] > 0]
+        fig = _budget_pie(tuple(item[0] for item in shown), tuple(item[1] for item in shown))
         st.plotly_chart(fig, use_container_width=True)
         
-        # Cost table
-        for item, cost, desc in budget_items:
-            if cost > 0:
-                st.markdown(f"**{item}:** €{cost:,.0f}")
-                st.caption(desc)
+        # Cost table, emitted as one element
+        st.markdown("".join(
+            f"<p style='margin: 0 0 0.6rem 0;'><b>{item}:</b> €{cost:,.0f}<br>"
+            f"<small style='color: #888;'>{desc}</small></p>"
+            for item, cost, desc in shown
+        ), unsafe_allow_html=True)
         
         st.markdown("---")
         
@@ -940,38 +862,124 @@ def render_budget_calculator(df: pd.DataFrame, target: str):
     
     roi = ((risk_reduction - total_cost) / total_cost) * 100 if total_cost > 0 else 0
     
-    with col1:
-        st.markdown(f"""
-        <div class='metric-box metric-box-critical'>
-            <p style='margin: 0; color: #888;'>Expected Loss (Without PQC)</p>
-            <h2 style='margin: 0; color: #ff4444;'>€{expected_loss_without:,.0f}</h2>
-            <p style='margin: 0; font-size: 0.8rem;'>{breach_probability_without*100:.0f}% breach probability</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class='metric-box metric-box-success'>
-            <p style='margin: 0; color: #888;'>Expected Loss (With PQC)</p>
-            <h2 style='margin: 0; color: #00f5d4;'>€{expected_loss_with:,.0f}</h2>
-            <p style='margin: 0; font-size: 0.8rem;'>{breach_probability_with*100:.0f}% breach probability</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        roi_color = "#00f5d4" if roi > 0 else "#ff4444"
-        st.markdown(f"""
-        <div class='metric-box metric-box-quantum'>
-            <p style='margin: 0; color: #888;'>Return on Investment</p>
-            <h2 style='margin: 0; color: {roi_color};'>{roi:,.0f}%</h2>
-            <p style='margin: 0; font-size: 0.8rem;'>Risk reduction value: €{risk_reduction:,.0f}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    roi_cards = (
+        (col1, {"variant": "metric-box-critical", "label": "Expected Loss (Without PQC)", "color": "#ff4444",
+                "value": f"€{expected_loss_without:,.0f}",
+                "note": f"{breach_probability_without*100:.0f}% breach probability"}),
+        (col2, {"variant": "metric-box-success", "label": "Expected Loss (With PQC)", "color": "#00f5d4",
+                "value": f"€{expected_loss_with:,.0f}",
+                "note": f"{breach_probability_with*100:.0f}% breach probability"}),
+        (col3, {"variant": "metric-box-quantum", "label": "Return on Investment",
+                "color": "#00f5d4" if roi > 0 else "#ff4444",
+                "value": f"{roi:,.0f}%",
+                "note": f"Risk reduction value: €{risk_reduction:,.0f}"}),
+    )
+    for col, ctx in roi_cards:
+        col.markdown(_ROI_CARD_HTML.format_map(ctx), unsafe_allow_html=True)
 
 # ============================================================================
 # ISMS FRAMEWORK DISPLAY
 # ============================================================================
 
+# Card templates for the ISMS view, filled per card
+_SCORECARD_HTML = """
+<div class='glass-card'>
+    <h4 style='color: {color};'>{title}</h4>
+    <div class='score-bar-container'>
+        <div class='score-bar-fill' style='width: {score}%; background: linear-gradient(90deg, {gradient});'>{score}%</div>
+    </div>
+    <p style='font-size: 0.85rem; margin-top: 0.5rem;'>{caption}</p>
+</div>
+"""
+
+_ISO_CONTROL_HTML = """
+<div style='background: rgba(0,0,0,0.3); padding: 1rem; border-radius: 10px; margin: 0.5rem 0; border-left: 4px solid {impact_color};'>
+    <h4 style='margin: 0;'>{c.id} - {c.name}</h4>
+    <p style='margin: 0.5rem 0; color: #888;'>{c.description}</p>
+    <p style='margin: 0;'><span style='color: {impact_color};'>⚛️ Quantum Impact: {c.quantum_impact}</span></p>
+    <p style='margin: 0.5rem 0;'><strong>Quantum Requirement:</strong> {c.quantum_requirement}</p>
+    <details>
+        <summary style='cursor: pointer; color: #00f5d4;'>📋 Implementation Steps</summary>
+        <pre style='background: #1a1a2e; padding: 0.5rem; border-radius: 5px; margin-top: 0.5rem;'>{c.implementation}</pre>
+    </details>
+</div>
+"""
+
+# One colour scale for ISO quantum impact, BSI priority and NIS2 status;
+# anything not listed (MEDIUM, P2, RECOMMENDED) is shown in yellow
+SEVERITY_COLORS = {
+    "CRITICAL": "#ff4444", "P0": "#ff4444",
+    "HIGH": "#ff8c00", "P1": "#ff8c00", "REQUIRED": "#ff8c00",
+}
+
+def _severity_color(level: str) -> str:
+    return SEVERITY_COLORS.get(level, "#ffd700")
+
+# Collapsible framework entry; expand/collapse stays in the browser
+_FW_DETAILS_HTML = "<details class='fw-details'><summary><strong>{summary}</strong></summary>{body}</details>"
+
+_BSI_BODY_HTML = """<p><strong>Description:</strong> {b[description]}</p>
+<p><strong>Quantum Requirement:</strong> {b[quantum_req]}</p>
+<p><span style='color: {priority_color};'>Priority: {b[priority]}</span></p>"""
+
+_NIS2_BODY_HTML = """<p><strong>Requirement:</strong> {req[description]}</p>
+<p><strong>Quantum Gap:</strong> {req[quantum_gap]}</p>
+<p><span style='color: {status_color};'>Status: {req[status]} | Priority: {req[priority]}</span></p>"""
+
+@st.cache_data(show_spinner=False)
+def _scorecards_html(iso_score: int, bsi_score: int, nis2_score: int) -> str:
+    """The three framework scorecards as one grid; scores are the only input"""
+    scorecards = (
+        {"title": "📜 ISO 27001", "color": "#00f5d4", "score": iso_score,
+         "gradient": "#00f5d4, #00bbf9", "caption": "Statement of Applicability with quantum controls"},
+        {"title": "🇩🇪 BSI Grundschutz", "color": "#9d4edd", "score": bsi_score,
+         "gradient": "#7b2cbf, #9d4edd", "caption": "IT-Grundschutz Bausteine mapping"},
+        {"title": "🇪🇺 NIS2 Directive", "color": "#f9a825", "score": nis2_score,
+         "gradient": "#f9a825, #ff8f00", "caption": "Article 21 compliance assessment"},
+    )
+    return "<div class='triple-grid'>" + "".join(_SCORECARD_HTML.format_map(ctx) for ctx in scorecards) + "</div>"
+
+@st.cache_data(show_spinner=False)
+def _iso_domain_html(domain_id: str) -> str:
+    """All control cards of one ISO 27001 domain, joined for a single write"""
+    parts = []
+    for control in ISO_27001_CONTROLS[domain_id]['controls']:
+        parts.append(_ISO_CONTROL_HTML.format(c=control, impact_color=_severity_color(control.quantum_impact)))
+    return "".join(parts)
+
+@st.cache_data(show_spinner=False)
+def _iso_details_html() -> str:
+    """Every ISO 27001 domain as a collapsible block of control cards"""
+    return "".join(
+        _FW_DETAILS_HTML.format(summary=f"{domain_id} - {domain_data['name']}",
+                                body=_iso_domain_html(domain_id))
+        for domain_id, domain_data in ISO_27001_CONTROLS.items()
+    )
+
+@st.cache_data(show_spinner=False)
+def _bsi_details_html() -> str:
+    """BSI Bausteine grouped by category, one collapsible block each"""
+    parts = []
+    for category, bausteine in BSI_BAUSTEINE.items():
+        parts.append(f"<h4>{category} - Bausteine</h4>")
+        for b in bausteine:
+            parts.append(_FW_DETAILS_HTML.format(
+                summary=f"{b['id']} - {b['name']} [{b['priority']}]",
+                body=_BSI_BODY_HTML.format(b=b, priority_color=_severity_color(b['priority']))))
+    return "".join(parts)
+
+@st.cache_data(show_spinner=False)
+def _nis2_details_html() -> str:
+    """NIS2 Article 21 requirements, one collapsible block each"""
+    parts = []
+    for req in NIS2_REQUIREMENTS:
+        parts.append(_FW_DETAILS_HTML.format(
+            summary=f"Article {req['article']} - {req['name']} [{req['status']}]",
+            body=_NIS2_BODY_HTML.format(req=req, status_color=_severity_color(req['status']))))
+    return "".join(parts)
+
+ISMS_FRAMEWORKS = ("📜 ISO 27001", "🇩🇪 BSI Grundschutz", "🇪🇺 NIS2 Article 21")
+
 def render_isms_framework(df: pd.DataFrame, target: str):
     """Full ISMS Framework display with ISO, BSI, NIS2"""
     
@@ -980,7 +988,7 @@ def render_isms_framework(df: pd.DataFrame, target: str):
     
     # Compliance Overview
     total = len(df)
-    critical = len(df[df['Quantum_Risk'].str.contains('Critical', na=False)])
+    critical = _risk_counts(df)['Critical']
     
     # Calculate compliance scores
     iso_score = max(20, 100 - (critical * 10))
@@ -989,236 +997,295 @@ def render_isms_framework(df: pd.DataFrame, target: str):
     
     st.markdown("### 📊 Compliance Scorecards")
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown(f"""
-        <div class='glass-card'>
-            <h4 style='color: #00f5d4;'>📜 ISO 27001</h4>
-            <div class='score-bar-container'>
-                <div class='score-bar-fill' style='width: {iso_score}%; background: linear-gradient(90deg, #00f5d4, #00bbf9);'>{iso_score}%</div>
-            </div>
-            <p style='font-size: 0.85rem; margin-top: 0.5rem;'>Statement of Applicability with quantum controls</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class='glass-card'>
-            <h4 style='color: #9d4edd;'>🇩🇪 BSI Grundschutz</h4>
-            <div class='score-bar-container'>
-                <div class='score-bar-fill' style='width: {bsi_score}%; background: linear-gradient(90deg, #7b2cbf, #9d4edd);'>{bsi_score}%</div>
-            </div>
-            <p style='font-size: 0.85rem; margin-top: 0.5rem;'>IT-Grundschutz Bausteine mapping</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-        <div class='glass-card'>
-            <h4 style='color: #f9a825;'>🇪🇺 NIS2 Directive</h4>
-            <div class='score-bar-container'>
-                <div class='score-bar-fill' style='width: {nis2_score}%; background: linear-gradient(90deg, #f9a825, #ff8f00);'>{nis2_score}%</div>
-            </div>
-            <p style='font-size: 0.85rem; margin-top: 0.5rem;'>Article 21 compliance assessment</p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_scorecards_html(iso_score, bsi_score, nis2_score), unsafe_allow_html=True)
     
     st.markdown("---")
     
-    # Tabbed framework details
-    fw_tabs = st.tabs(["📜 ISO 27001", "🇩🇪 BSI Grundschutz", "🇪🇺 NIS2 Article 21"])
+    # Framework details; a keyed selector instead of st.tabs so only the
+    # chosen framework's body runs and the choice survives reruns
+    framework = st.radio("Framework", ISMS_FRAMEWORKS, horizontal=True,
+                         label_visibility="collapsed", key="isms_framework")
     
     # ISO 27001 Tab
-    with fw_tabs[0]:
+    if framework == ISMS_FRAMEWORKS[0]:
         st.markdown("### ISO 27001:2022 Statement of Applicability")
         st.markdown(f"**Scope:** {target} - All {total} discovered assets")
         st.markdown(f"**Critical Controls Required:** {critical}")
         
-        for domain_id, domain_data in ISO_27001_CONTROLS.items():
-            with st.expander(f"**{domain_id} - {domain_data['name']}**", expanded=False):
-                for control in domain_data['controls']:
-                    impact_color = "#ff4444" if control['quantum_impact'] == "CRITICAL" else "#ff8c00" if control['quantum_impact'] == "HIGH" else "#ffd700"
-                    
-                    st.markdown(f"""
-                    <div style='background: rgba(0,0,0,0.3); padding: 1rem; border-radius: 10px; margin: 0.5rem 0; border-left: 4px solid {impact_color};'>
-                        <h4 style='margin: 0;'>{control['id']} - {control['name']}</h4>
-                        <p style='margin: 0.5rem 0; color: #888;'>{control['description']}</p>
-                        <p style='margin: 0;'><span style='color: {impact_color};'>⚛️ Quantum Impact: {control['quantum_impact']}</span></p>
-                        <p style='margin: 0.5rem 0;'><strong>Quantum Requirement:</strong> {control['quantum_requirement']}</p>
-                        <details>
-                            <summary style='cursor: pointer; color: #00f5d4;'>📋 Implementation Steps</summary>
-                            <pre style='background: #1a1a2e; padding: 0.5rem; border-radius: 5px; margin-top: 0.5rem;'>{control['implementation']}</pre>
-                        </details>
-                    </div>
-                    """, unsafe_allow_html=True)
+        st.markdown(_iso_details_html(), unsafe_allow_html=True)
     
     # BSI Tab
-    with fw_tabs[1]:
+    elif framework == ISMS_FRAMEWORKS[1]:
         st.markdown("### BSI IT-Grundschutz Compendium 2024")
         st.markdown("German Federal Office for Information Security framework mapping.")
         
-        for category, bausteine in BSI_BAUSTEINE.items():
-            st.markdown(f"#### {category} - Bausteine")
-            for b in bausteine:
-                priority_color = "#ff4444" if b['priority'] == "P0" else "#ff8c00" if b['priority'] == "P1" else "#ffd700"
-                
-                with st.expander(f"**{b['id']} - {b['name']}** [{b['priority']}]"):
-                    st.markdown(f"**Description:** {b['description']}")
-                    st.markdown(f"**Quantum Requirement:** {b['quantum_req']}")
-                    st.markdown(f"<span style='color: {priority_color};'>Priority: {b['priority']}</span>", unsafe_allow_html=True)
+        st.markdown(_bsi_details_html(), unsafe_allow_html=True)
     
     # NIS2 Tab
-    with fw_tabs[2]:
+    else:
         st.markdown("### NIS2 Directive - Article 21 Compliance")
         st.markdown("EU Network and Information Security Directive requirements.")
         
         st.markdown(f"**Entity Classification:** Essential Entity (presumed)")
         st.markdown(f"**Critical Gaps Identified:** {critical}")
         
-        for req in NIS2_REQUIREMENTS:
-            status_color = "#ff4444" if req['status'] == "CRITICAL" else "#ff8c00" if req['status'] == "REQUIRED" else "#ffd700"
-            
-            with st.expander(f"**Article {req['article']} - {req['name']}** [{req['status']}]"):
-                st.markdown(f"**Requirement:** {req['description']}")
-                st.markdown(f"**Quantum Gap:** {req['quantum_gap']}")
-                st.markdown(f"<span style='color: {status_color};'>Status: {req['status']} | Priority: {req['priority']}</span>", unsafe_allow_html=True)
+        st.markdown(_nis2_details_html(), unsafe_allow_html=True)
 
 # ============================================================================
 # THREAT RADAR EXPLANATIONS
 # ============================================================================
 
-def render_threat_radar_explained(df: pd.DataFrame):
-    """Threat radar with full explanations"""
+# Mid-sized scans are drawn client-side through one clustered layer;
+# the other modes keep individual CircleMarkers
+CLUSTERED_MAP_MODES = ("Deep Quantum Analysis", "Stealth Mode")
+
+_CLUSTER_MARKER_JS = """
+function (row) {
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: row[4], color: row[3], fill: true, fillColor: row[3], fillOpacity: 0.7
+    });
+    marker.bindPopup(row[2], {maxWidth: 350});
+    marker.bindTooltip(row[5]);
+    return marker;
+}
+"""
+
+# Marker styling per risk tier, indexed by the risk_tier category code
+TIER_COLORS = np.array(['#ff4444', '#ff8c00', '#ffd700', '#00f5d4'])
+TIER_RADII = np.array([12, 10, 8, 6])
+
+def _tier_codes(df: pd.DataFrame) -> np.ndarray:
+    """risk_tier category codes (0=Critical .. 3=Low); unknowns fall to Low"""
+    codes = df['risk_tier'].cat.codes.to_numpy()
+    return np.where(codes < 0, len(RISK_TIERS) - 1, codes)
+
+def _tier_counts(df: pd.DataFrame) -> np.ndarray:
+    """Asset counts per tier in RISK_TIERS order, from one pass over the codes"""
+    return np.bincount(_tier_codes(df), minlength=len(RISK_TIERS))
+
+def _risk_counts(df: pd.DataFrame) -> dict:
+    """Tier -> asset count, stamped on the frame by run_audit()"""
+    counts = df.attrs.get('risk_counts')
+    if counts is None:
+        counts = dict(zip(RISK_TIERS, _tier_counts(df).tolist()))
+    return counts
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _risk_summary(_df: pd.DataFrame, fingerprint: str, quantum: bool) -> dict:
+    """Headline metrics for the results page, derived once per audit"""
+    df = _df
+    counts = _risk_counts(df)
+    # Standard Recon leaves every asset at 0 years, so only quantum modes count
+    years = df.get('quantum_years_vulnerable')
+    qv = int((years.to_numpy() <= 5).sum()) if quantum and years is not None else 0
+    return {
+        'total': len(df),
+        'critical': counts['Critical'],
+        'high': counts['High'],
+        'quantum': qv,
+        'avg': float(df['Risk_Score'].mean()),
+    }
+
+# Columns the threat map reads, projected once per audit by _audit_frames()
+_MAP_COLUMNS = ['asset', 'lat', 'lon', 'city', 'country', 'ip', 'criticality',
+                'Quantum_Risk', 'Risk_Score', 'quantum_threat_algorithm',
+                'quantum_years_vulnerable', 'PQC_Migration', 'Solution', 'risk_tier']
+
+# Heat layer styling; large scans are binned onto a coarse grid first
+HEAT_GRADIENT = {0.4: 'blue', 0.6: 'lime', 0.8: 'orange', 1: 'red'}
+HEAT_BIN_THRESHOLD = 200
+HEAT_BIN_DEGREES = 0.5
+
+def _heat_points(lat: np.ndarray, lon: np.ndarray, weight: np.ndarray) -> list:
+    """[lat, lon, weight] heat points; above the threshold, points sharing a
+    grid cell are merged and their weights summed"""
+    if len(lat) <= HEAT_BIN_THRESHOLD:
+        return np.column_stack([lat, lon, weight]).tolist()
+    cells = np.round(np.column_stack([lat, lon]) / HEAT_BIN_DEGREES) * HEAT_BIN_DEGREES
+    cells, inverse = np.unique(cells, axis=0, return_inverse=True)
+    weights = np.bincount(inverse.ravel(), weights=weight, minlength=len(cells))
+    return np.column_stack([cells, weights]).tolist()
+
+def _asset_marker_style(feature: dict) -> dict:
+    """Per-asset circle styling, read from the feature's properties"""
+    props = feature['properties']
+    return {'color': props['color'], 'fillColor': props['color'],
+            'fillOpacity': 0.7, 'radius': props['radius']}
+
+def _build_threat_map(df: pd.DataFrame, mode: str) -> "folium.Map":
+    """Build the threat radar map for an asset set and mode"""
+    import folium
+    from folium.plugins import HeatMap, FastMarkerCluster
     
-    st.markdown("## 🗺️ Global Threat Radar")
+    m = folium.Map(location=[30, 0], zoom_start=2, tiles="CartoDB dark_matter")
     
-    # Legend
-    col1, col2, col3, col4 = st.columns(4)
+    # Only geolocated assets are plotted; style each marker by its tier code
+    located = df[(df['lat'] != 0) & (df['lon'] != 0)]
+    codes = _tier_codes(located)
+    color_arr = TIER_COLORS[codes]
+    colors = color_arr.tolist()
+    radii = TIER_RADII[codes].tolist()
+    lats = located['lat'].tolist()
+    lons = located['lon'].tolist()
+    
+    # Rich popups and tooltips, formatted column-wise instead of per marker
+    text = {col: located[col].astype(str) for col in _MAP_COLUMNS if col not in ('lat', 'lon', 'risk_tier')}
+    popups = (
+        "<div style='width: 300px; font-family: Arial;'>"
+        "<h3 style='margin: 0; color: " + pd.Series(color_arr, index=located.index) + ";'>" + text['asset'] + "</h3>"
+        "<hr style='margin: 5px 0; border-color: #333;'>"
+        "<p><b>📍 Location:</b> " + text['city'] + ", " + text['country'] + "</p>"
+        "<p><b>🔗 IP:</b> " + text['ip'] + "</p>"
+        "<p><b>⚠️ Risk Level:</b> " + text['Quantum_Risk'] + "</p>"
+        "<p><b>📊 Risk Score:</b> " + text['Risk_Score'] + "/100</p>"
+        "<p><b>🎯 Criticality:</b> " + text['criticality'] + "</p>"
+        "<hr style='margin: 5px 0; border-color: #333;'>"
+        "<p><b>⚛️ Quantum Threat:</b> " + text['quantum_threat_algorithm'] + "</p>"
+        "<p><b>⏰ Years Vulnerable:</b> " + text['quantum_years_vulnerable'] + "</p>"
+        "<p><b>💎 PQC Strategy:</b> " + text['PQC_Migration'] + "</p>"
+        "<hr style='margin: 5px 0; border-color: #333;'>"
+        "<p><b>🔧 Action:</b> " + text['Solution'].str.slice(0, 100) + "...</p>"
+        "</div>"
+    ).tolist()
+    tooltips = (text['asset'] + " - " + text['Quantum_Risk']).tolist()
+    
+    if mode in CLUSTERED_MAP_MODES:
+        cluster_rows = [list(r) for r in zip(lats, lons, popups, colors, radii, tooltips)]
+    else:
+        cluster_rows = []
+        # All markers travel as one GeoJSON layer instead of a layer per asset
+        features = [
+            {'type': 'Feature',
+             'geometry': {'type': 'Point', 'coordinates': [lon, lat]},
+             'properties': {'popup': popup_html, 'tooltip': tooltip, 'color': color, 'radius': radius}}
+            for lat, lon, popup_html, color, radius, tooltip in zip(lats, lons, popups, colors, radii, tooltips)
+        ]
+        # folium probes the style function on the first feature, so skip empty layers
+        if features:
+            folium.GeoJson(
+                {'type': 'FeatureCollection', 'features': features},
+                name="Assets",
+                marker=folium.CircleMarker(fill=True),
+                style_function=_asset_marker_style,
+                popup=folium.GeoJsonPopup(fields=['popup'], labels=False, max_width=350),
+                tooltip=folium.GeoJsonTooltip(fields=['tooltip'], labels=False),
+            ).add_to(m)
     
-    with col1:
-        st.markdown("""
-        <div style='background: rgba(255,68,68,0.2); padding: 1rem; border-radius: 10px; border: 2px solid #ff4444;'>
-            <h4 style='color: #ff4444; margin: 0;'>🔴 Critical (HNDL)</h4>
-            <p style='font-size: 0.85rem; margin: 0.5rem 0 0 0;'>Harvest Now, Decrypt Later threat. Data at immediate risk. Score: 80-100</p>
-        </div>
-        """, unsafe_allow_html=True)
+    heat_data = _heat_points(located['lat'].to_numpy(dtype=float),
+                             located['lon'].to_numpy(dtype=float),
+                             located['Risk_Score'].to_numpy(dtype=float) / 100)
     
-    with col2:
-        st.markdown("""
-        <div style='background: rgba(255,140,0,0.2); padding: 1rem; border-radius: 10px; border: 2px solid #ff8c00;'>
-            <h4 style='color: #ff8c00; margin: 0;'>🟠 High Risk</h4>
-            <p style='font-size: 0.85rem; margin: 0.5rem 0 0 0;'>Quantum vulnerable within 5 years. Urgent PQC migration needed. Score: 60-79</p>
-        </div>
-        """, unsafe_allow_html=True)
+    if cluster_rows:
+        FastMarkerCluster(data=cluster_rows, callback=_CLUSTER_MARKER_JS).add_to(m)
     
-    with col3:
-        st.markdown("""
-        <div style='background: rgba(255,215,0,0.2); padding: 1rem; border-radius: 10px; border: 2px solid #ffd700;'>
-            <h4 style='color: #ffd700; margin: 0;'>🟡 Medium Risk</h4>
-            <p style='font-size: 0.85rem; margin: 0.5rem 0 0 0;'>Standard vulnerabilities. Plan PQC migration. Score: 40-59</p>
-        </div>
-        """, unsafe_allow_html=True)
+    # Add heatmap layer
+    if heat_data:
+        HeatMap(heat_data, radius=25, blur=20, gradient=HEAT_GRADIENT).add_to(m)
     
-    with col4:
-        st.markdown("""
-        <div style='background: rgba(0,245,212,0.2); padding: 1rem; border-radius: 10px; border: 2px solid #00f5d4;'>
-            <h4 style='color: #00f5d4; margin: 0;'>🟢 Low Risk</h4>
-            <p style='font-size: 0.85rem; margin: 0.5rem 0 0 0;'>Acceptable security posture. Continue monitoring. Score: 0-39</p>
-        </div>
-        """, unsafe_allow_html=True)
+    return m
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _threat_map_html(_df: pd.DataFrame, fingerprint: str, mode: str) -> str:
+    """Render the threat map to standalone HTML once per audit and mode"""
+    return _build_threat_map(_df, mode).get_root().render()
+
+# Static risk legend above the map, emitted as one four-column grid
+RADAR_LEGEND_HTML = """
+<div class='legend-grid'>
+    <div style='background: rgba(255,68,68,0.2); padding: 1rem; border-radius: 10px; border: 2px solid #ff4444;'>
+        <h4 style='color: #ff4444; margin: 0;'>🔴 Critical (HNDL)</h4>
+        <p style='font-size: 0.85rem; margin: 0.5rem 0 0 0;'>Harvest Now, Decrypt Later threat. Data at immediate risk. Score: 80-100</p>
+    </div>
+    <div style='background: rgba(255,140,0,0.2); padding: 1rem; border-radius: 10px; border: 2px solid #ff8c00;'>
+        <h4 style='color: #ff8c00; margin: 0;'>🟠 High Risk</h4>
+        <p style='font-size: 0.85rem; margin: 0.5rem 0 0 0;'>Quantum vulnerable within 5 years. Urgent PQC migration needed. Score: 60-79</p>
+    </div>
+    <div style='background: rgba(255,215,0,0.2); padding: 1rem; border-radius: 10px; border: 2px solid #ffd700;'>
+        <h4 style='color: #ffd700; margin: 0;'>🟡 Medium Risk</h4>
+        <p style='font-size: 0.85rem; margin: 0.5rem 0 0 0;'>Standard vulnerabilities. Plan PQC migration. Score: 40-59</p>
+    </div>
+    <div style='background: rgba(0,245,212,0.2); padding: 1rem; border-radius: 10px; border: 2px solid #00f5d4;'>
+        <h4 style='color: #00f5d4; margin: 0;'>🟢 Low Risk</h4>
+        <p style='font-size: 0.85rem; margin: 0.5rem 0 0 0;'>Acceptable security posture. Continue monitoring. Score: 0-39</p>
+    </div>
+</div>
+"""
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _geo_risk_fig(_df: pd.DataFrame, fingerprint: str):
+    """Top-10 countries by asset count, coloured by average risk"""
+    df = _df
+    import plotly.express as px
+    
+    geo_stats = (df.groupby('country', sort=False, observed=True)
+                   .agg(Avg_Risk=('Risk_Score', 'mean'), Assets=('asset', 'size'))
+                   .nlargest(10, 'Assets')
+                   .rename_axis('Country')
+                   .reset_index())
+    
+    fig = px.bar(geo_stats, x='Country', y='Assets', color='Avg_Risk',
+                 labels={'Avg_Risk': 'Avg Risk'},
+                 color_continuous_scale=['#00f5d4', '#ffd700', '#ff8c00', '#ff4444'])
+    fig.update_layout(**DARK_LAYOUT, height=300)
+    return fig
+
+def render_threat_radar_explained(map_df: pd.DataFrame, geo_df: pd.DataFrame, mode: str):
+    """Threat radar with full explanations"""
+    st.markdown("## 🗺️ Global Threat Radar")
+    
+    # Legend
+    st.markdown(RADAR_LEGEND_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     
     # Map
-    m = folium.Map(location=[30, 0], zoom_start=2, tiles="CartoDB dark_matter")
-    
-    heat_data = []
-    
-    for _, row in df.iterrows():
-        if row['lat'] != 0 and row['lon'] != 0:
-            # Determine color and size based on risk
-            risk = str(row['Quantum_Risk'])
-            score = row['Risk_Score']
-            
-            if 'Critical' in risk:
-                color = '#ff4444'
-                radius = 12
-            elif 'High' in risk:
-                color = '#ff8c00'
-                radius = 10
-            elif 'Medium' in risk or 'Moderate' in risk:
-                color = '#ffd700'
-                radius = 8
-            else:
-                color = '#00f5d4'
-                radius = 6
-            
-            # Rich popup
-            popup_html = f"""
-            <div style='width: 300px; font-family: Arial;'>
-                <h3 style='margin: 0; color: {color};'>{row['asset']}</h3>
-                <hr style='margin: 5px 0; border-color: #333;'>
-                <p><b>📍 Location:</b> {row['city']}, {row['country']}</p>
-                <p><b>🔗 IP:</b> {row['ip']}</p>
-                <p><b>⚠️ Risk Level:</b> {row['Quantum_Risk']}</p>
-                <p><b>📊 Risk Score:</b> {score}/100</p>
-                <p><b>🎯 Criticality:</b> {row['criticality']}</p>
-                <hr style='margin: 5px 0; border-color: #333;'>
-                <p><b>⚛️ Quantum Threat:</b> {row.get('quantum_threat_algorithm', 'N/A')}</p>
-                <p><b>⏰ Years Vulnerable:</b> {row.get('quantum_years_vulnerable', 'N/A')}</p>
-                <p><b>💎 PQC Strategy:</b> {row.get('PQC_Migration', 'N/A')}</p>
-                <hr style='margin: 5px 0; border-color: #333;'>
-                <p><b>🔧 Action:</b> {row['Solution'][:100]}...</p>
-            </div>
-            """
-            
-            folium.CircleMarker(
-                location=[row['lat'], row['lon']],
-                radius=radius,
-                color=color,
-                fill=True,
-                fillColor=color,
-                fillOpacity=0.7,
-                popup=folium.Popup(popup_html, max_width=350),
-                tooltip=f"{row['asset']} - {row['Quantum_Risk']}"
-            ).add_to(m)
-            
-            # Add to heatmap
-            heat_data.append([row['lat'], row['lon'], score/100])
-    
-    # Add heatmap layer
-    if heat_data:
-        HeatMap(heat_data, radius=25, blur=20, gradient={0.4: 'blue', 0.6: 'lime', 0.8: 'orange', 1: 'red'}).add_to(m)
-    
-    st_folium(m, width=1200, height=500)
+    components.html(_threat_map_html(map_df, _fingerprint(map_df), mode), height=500)
     
     # Geographic distribution
     st.markdown("### 🌍 Geographic Risk Distribution")
     
-    geo_stats = df.groupby('country').agg({
-        'Risk_Score': 'mean',
-        'asset': 'count'
-    }).reset_index()
-    geo_stats.columns = ['Country', 'Avg Risk', 'Assets']
-    geo_stats = geo_stats.sort_values('Assets', ascending=False).head(10)
-    
-    fig = px.bar(geo_stats, x='Country', y='Assets', color='Avg Risk',
-                 color_continuous_scale=['#00f5d4', '#ffd700', '#ff8c00', '#ff4444'])
-    fig.update_layout(template="plotly_dark", paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', height=300)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_geo_risk_fig(geo_df, _fingerprint(geo_df)),
+                    use_container_width=True, key="geo_risk")
 
 # ============================================================================
 # PDF GENERATORS
 # ============================================================================
 
+# Blocks use fpdf2's markdown: **bold** and __italic__ keep the per-control
+# emphasis while each section is still written with a single multi_cell
+@st.cache_resource(show_spinner=False)
+def _framework_pdf_blocks():
+    """Pre-wrap the static framework catalogues into one text block per PDF section"""
+    iso_blocks = [
+        (f"{domain_id} - {domain_data['name']}",
+         "\n".join(f"  {c.id}: {c.name} [{c.quantum_impact}]\n"
+                   f"    __Quantum: {c.quantum_requirement[:100]}...__"
+                   for c in domain_data['controls']))
+        for domain_id, domain_data in ISO_27001_CONTROLS.items()
+    ]
+    bsi_blocks = [
+        (f"{category} Bausteine",
+         "\n".join(f"  {b['id']}: {b['name']} [{b['priority']}]\n"
+                   f"    __{b['quantum_req'][:100]}...__"
+                   for b in bausteine))
+        for category, bausteine in BSI_BAUSTEINE.items()
+    ]
+    nis2_block = "\n\n".join(
+        f"**Art {req['article']}: {req['name']} [{req['status']}]**\n  Gap: {req['quantum_gap']}"
+        for req in NIS2_REQUIREMENTS
+    )
+    return iso_blocks, bsi_blocks, nis2_block
+
 def generate_full_isms_pdf(df: pd.DataFrame, target: str, mode: str) -> bytes:
     """Generate comprehensive ISMS PDF"""
+    from fpdf import FPDF
+    
     pdf = FPDF()
     
     total = len(df)
-    critical = len(df[df['Quantum_Risk'].str.contains('Critical', na=False)])
-    high = len(df[df['Quantum_Risk'].str.contains('High', na=False)])
+    counts = _risk_counts(df)
+    critical, high = counts['Critical'], counts['High']
+    iso_blocks, bsi_blocks, nis2_block = _framework_pdf_blocks()
     
     # Cover
     pdf.add_page()
@@ -1286,15 +1353,11 @@ RECOMMENDATIONS:
     pdf.cell(0, 8, f"Critical Controls Required: {critical}", ln=True)
     pdf.ln(5)
     
-    for domain_id, domain_data in ISO_27001_CONTROLS.items():
+    for heading, body in iso_blocks:
         pdf.set_font("Arial", 'B', 11)
-        pdf.cell(0, 8, f"{domain_id} - {domain_data['name']}", ln=True)
+        pdf.cell(0, 8, heading, ln=True)
         pdf.set_font("Arial", '', 9)
-        for control in domain_data['controls']:
-            pdf.cell(0, 5, f"  {control['id']}: {control['name']} [{control['quantum_impact']}]", ln=True)
-            pdf.set_font("Arial", 'I', 8)
-            pdf.multi_cell(0, 4, f"    Quantum: {control['quantum_requirement'][:100]}...")
-            pdf.set_font("Arial", '', 9)
+        pdf.multi_cell(0, 5, body, markdown=True)
         pdf.ln(2)
     
     # BSI
@@ -1305,15 +1368,11 @@ RECOMMENDATIONS:
     pdf.set_text_color(0, 0, 0)
     pdf.set_font("Arial", '', 10)
     
-    for category, bausteine in BSI_BAUSTEINE.items():
+    for heading, body in bsi_blocks:
         pdf.set_font("Arial", 'B', 11)
-        pdf.cell(0, 8, f"{category} Bausteine", ln=True)
+        pdf.cell(0, 8, heading, ln=True)
         pdf.set_font("Arial", '', 9)
-        for b in bausteine:
-            pdf.cell(0, 5, f"  {b['id']}: {b['name']} [{b['priority']}]", ln=True)
-            pdf.set_font("Arial", 'I', 8)
-            pdf.multi_cell(0, 4, f"    {b['quantum_req'][:100]}...")
-            pdf.set_font("Arial", '', 9)
+        pdf.multi_cell(0, 5, body, markdown=True)
     
     # NIS2
     pdf.add_page()
@@ -1327,12 +1386,8 @@ RECOMMENDATIONS:
     pdf.cell(0, 8, f"Critical Gaps: {critical}", ln=True)
     pdf.ln(5)
     
-    for req in NIS2_REQUIREMENTS:
-        pdf.set_font("Arial", 'B', 10)
-        pdf.cell(0, 6, f"Art {req['article']}: {req['name']} [{req['status']}]", ln=True)
-        pdf.set_font("Arial", '', 9)
-        pdf.multi_cell(0, 4, f"  Gap: {req['quantum_gap']}")
-        pdf.ln(1)
+    pdf.set_font("Arial", '', 9)
+    pdf.multi_cell(0, 5, nis2_block, markdown=True)
     
     # Budget
     pdf.add_page()
@@ -1374,29 +1429,122 @@ RECOMMENDATIONS:
     pdf.set_text_color(123, 44, 191)
     pdf.cell(0, 5, "Generated by Sentinel-V | ProSec Networks | Quantum-Ready Security", ln=True, align='C')
     
-    return pdf.output(dest='S').encode('latin-1')
+    return pdf_bytes(pdf)
+
+# Explicit column config so the intelligence table skips type inference
+INTEL_COLUMN_CONFIG = {
+    'asset': st.column_config.TextColumn("Asset"),
+    'ip': st.column_config.TextColumn("IP"),
+    'country': st.column_config.TextColumn("Country"),
+    'criticality': st.column_config.TextColumn("Criticality"),
+    'Quantum_Risk': st.column_config.TextColumn("Quantum Risk"),
+    'Risk_Score': st.column_config.ProgressColumn("Risk Score", min_value=0, max_value=100, format="%.0f"),
+    'quantum_years_vulnerable': st.column_config.NumberColumn("Years Vulnerable"),
+    'PQC_Migration': st.column_config.TextColumn("PQC Migration"),
+    'PQC_Priority': st.column_config.TextColumn("PQC Priority"),
+}
+
+INTEL_TABLE_COLUMNS = ['asset', 'ip', 'country', 'criticality', 'Quantum_Risk', 'Risk_Score']
+INTEL_TABLE_QUANTUM_COLUMNS = INTEL_TABLE_COLUMNS + ['quantum_years_vulnerable', 'PQC_Migration', 'PQC_Priority']
+GEO_COLUMNS = ['country', 'Risk_Score', 'asset']
+
+def _audit_frames(df: pd.DataFrame, quantum: bool) -> dict:
+    """Per-view column projections, taken once when an audit is stored
+    rather than sliced out of the full frame on every rerun"""
+    return {
+        'intel': df.loc[:, INTEL_TABLE_QUANTUM_COLUMNS if quantum else INTEL_TABLE_COLUMNS].copy(),
+        'map': df.loc[:, _MAP_COLUMNS].copy(),
+        'geo': df.loc[:, GEO_COLUMNS].copy(),
+    }
+
+def _frame_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a frame's values, independent of its index"""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+
+def _fingerprint(df: pd.DataFrame) -> str:
+    """The audit frame's content hash, stamped at ingest by _narrow()"""
+    return df.attrs.get('fingerprint') or _frame_fingerprint(df)
+
+# Export payloads are keyed on the audit fingerprint rather than the frame
+# itself, so reruns neither rebuild the bytes nor rehash every row to find them.
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_pdf_report(_df: pd.DataFrame, fingerprint: str, target: str, mode: str) -> bytes:
+    return generate_pdf_report(_df, target, mode)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_isms_pdf(_df: pd.DataFrame, fingerprint: str, target: str, mode: str) -> bytes:
+    return generate_full_isms_pdf(_df, target, mode)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_csv(_df: pd.DataFrame, fingerprint: str) -> bytes:
+    return _df.to_csv(index=False).encode()
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_json(_df: pd.DataFrame, fingerprint: str) -> bytes:
+    return orjson.dumps(_df.to_dict(orient='records'),
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+# Low-cardinality text columns are dictionary-encoded, the remaining text
+# columns moved to Arrow strings and small integer scores downcast once per
+# audit, before the frame is stored in the session
+NARROW_CATEGORY_COLUMNS = ('country', 'criticality', 'scan_mode', 'PQC_Priority',
+                           'Quantum_Risk', 'PQC_Migration')
+NARROW_INT_COLUMNS = ('Risk_Score', 'quantum_years_vulnerable')
+
+def _narrow(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink audit dtypes so Arrow payloads and exports stay small"""
+    df = df.copy()
+    for col in NARROW_INT_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in NARROW_CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col in df.select_dtypes(include='object').columns:
+        df[col] = df[col].astype('string[pyarrow]')
+    if 'risk_tier' in df.columns:
+        df['risk_tier'] = pd.Categorical(df['risk_tier'], categories=RISK_TIERS, ordered=True)
+    df.attrs['fingerprint'] = _frame_fingerprint(df)
+    return df
+
+# Repeat scans of the same target and mode within the hour reuse the
+# narrowed frame instead of redoing recon and analysis
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def _cached_audit(target: str, mode: str) -> pd.DataFrame:
+    with asyncio.Runner(loop_factory=_loop_factory) as runner:
+        return _narrow(runner.run(run_audit(target, mode)))
+
+# Title block and status bar shown above every view
+TITLE_HTML = """
+<h1 class='quantum-title'>SENTINEL-V</h1>
+<p style='text-align:center; color:#9d4edd; font-size:1.2rem; margin-top:-10px;'>QUANTUM AI NERVE CENTER</p>
+<p style='text-align:center; color:#666;'>Post-Quantum Cryptography Intelligence | ProSec Networks</p>
+"""
+
+STATUS_BAR_HTML = """
+<div class='status-row'>
+    <div class='metric-box metric-box-success'><small>STATUS</small><h3 style='color:#00f5d4;margin:0;'>ONLINE</h3></div>
+    <div class='metric-box metric-box-quantum'><small>QUANTUM</small><h3 style='color:#9d4edd;margin:0;'>ACTIVE</h3></div>
+    <div class='metric-box metric-box-critical'><small>CRQC THREAT</small><h3 style='color:#ff4444;margin:0;'>{yrs} YRS</h3></div>
+    <div class='metric-box metric-box-warning'><small>NIST PQC</small><h3 style='color:#f9a825;margin:0;'>FIPS 203/204</h3></div>
+</div>
+"""
+
+def _status_bar_html() -> str:
+    """Status bar with the CRQC countdown"""
+    return STATUS_BAR_HTML.format(yrs=_years_until_crqc())
 
 # ============================================================================
 # MAIN APPLICATION
 # ============================================================================
 
 # Header
-st.markdown("<h1 class='quantum-title'>SENTINEL-V</h1>", unsafe_allow_html=True)
-st.markdown("<p style='text-align:center; color:#9d4edd; font-size:1.2rem; margin-top:-10px;'>QUANTUM AI NERVE CENTER</p>", unsafe_allow_html=True)
-st.markdown("<p style='text-align:center; color:#666;'>Post-Quantum Cryptography Intelligence | ProSec Networks</p>", unsafe_allow_html=True)
+st.markdown(TITLE_HTML, unsafe_allow_html=True)
 
 # Status bar
 st.markdown("---")
-cols = st.columns(4)
-with cols[0]:
-    st.markdown("<div class='metric-box metric-box-success'><small>STATUS</small><h3 style='color:#00f5d4;margin:0;'>ONLINE</h3></div>", unsafe_allow_html=True)
-with cols[1]:
-    st.markdown("<div class='metric-box metric-box-quantum'><small>QUANTUM</small><h3 style='color:#9d4edd;margin:0;'>ACTIVE</h3></div>", unsafe_allow_html=True)
-with cols[2]:
-    yrs = 2030 - datetime.now().year
-    st.markdown(f"<div class='metric-box metric-box-critical'><small>CRQC THREAT</small><h3 style='color:#ff4444;margin:0;'>{yrs} YRS</h3></div>", unsafe_allow_html=True)
-with cols[3]:
-    st.markdown("<div class='metric-box metric-box-warning'><small>NIST PQC</small><h3 style='color:#f9a825;margin:0;'>FIPS 203/204</h3></div>", unsafe_allow_html=True)
+st.markdown(_status_bar_html(), unsafe_allow_html=True)
 
 st.markdown("---")
 
@@ -1404,8 +1552,6 @@ st.markdown("---")
 with st.sidebar:
     st.markdown("## ⚡ JARVIS")
     
-    target = st.text_input("🎯 Target Domain", placeholder="example.com")
-    
     st.markdown("### 🔧 Mode")
     mode = st.radio("Select", list(MODES.keys()), index=1, label_visibility="collapsed")
     
@@ -1424,11 +1570,16 @@ with st.sidebar:
     
     st.markdown("---")
     
-    if st.button(f"🚀 LAUNCH {mode.upper()}", use_container_width=True, type="primary"):
+    # Target and launch submit together, so typing a domain never reruns the app
+    with st.form("launch"):
+        target = st.text_input("🎯 Target Domain", placeholder="example.com")
+        launched = st.form_submit_button(f"🚀 LAUNCH {mode.upper()}", use_container_width=True, type="primary")
+    
+    if launched:
         if target and len(target) >= 4:
             st.session_state.jarvis_log = []
             jarvis("System initialized", "SYSTEM")
-            jarvis(m["jarvis_init"], "QUANTUM" if "Quantum" in mode else "SCAN")
+            jarvis(m["jarvis_init"], m["jarvis_level"])
             
             prog = st.progress(0)
             stat = st.empty()
@@ -1444,20 +1595,18 @@ with st.sidebar:
                 stat.info("🌐 Running reconnaissance...")
                 prog.progress(40)
                 
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
                 if m['specs']['quantum']:
                     jarvis("Quantum analyzers online", "QUANTUM")
                     stat.info("⚛️ Computing quantum vulnerabilities...")
                     prog.progress(60)
                 
-                df = loop.run_until_complete(run_audit(target, mode))
+                df = _cached_audit(target, mode)
                 
                 prog.progress(90)
                 jarvis(m["jarvis_complete"], "SUCCESS")
                 
                 st.session_state.audit_data = df
+                st.session_state.audit_frames = _audit_frames(df, m['specs']['quantum'])
                 st.session_state.current_scan_mode = mode
                 st.session_state.current_target = target
                 
@@ -1466,7 +1615,6 @@ with st.sidebar:
                 prog.empty()
                 
                 st.success(f"✅ {len(df)} assets analyzed")
-                loop.close()
                 st.rerun()
                 
             except Exception as e:
@@ -1482,38 +1630,31 @@ with st.sidebar:
     if st.session_state.audit_data is not None:
         if st.button("🔄 New Scan", use_container_width=True):
             st.session_state.audit_data = None
+            st.session_state.audit_frames = None
             st.rerun()
+    
+    if st.button("🗑️ Clear Scan Cache", use_container_width=True):
+        _cached_audit.clear()
+        st.toast("Scan cache cleared")
+    
+    st.checkbox("✨ Animations", key="animations_enabled")
+    if not st.session_state.animations_enabled:
+        st.markdown(
+            "<style>*, *::before, *::after { animation: none !important; transition: none !important; }</style>",
+            unsafe_allow_html=True
+        )
 
 # Main content
 if st.session_state.audit_data is None:
     # Welcome
     st.markdown("## 🎯 Select Mode & Enter Target")
     
-    cols = st.columns(4)
-    for i, (name, info) in enumerate(MODES.items()):
-        with cols[i]:
-            st.markdown(f"""
-            <div style='background:{info["gradient"]}; padding:1.5rem; border-radius:15px; height:220px;'>
-                <h2 style='margin:0;'>{info["icon"]}</h2>
-                <h4 style='margin:0.5rem 0; color:{info["text_color"]};'>{name}</h4>
-                <p style='font-size:0.8rem; color:{info["text_color"]}; opacity:0.8;'>{info["tagline"]}</p>
-            </div>
-            """, unsafe_allow_html=True)
+    st.markdown(MODE_GRID_HTML, unsafe_allow_html=True)
     
     st.markdown("---")
     st.markdown("### ⏰ Quantum Threat Timeline")
     
-    fig = go.Figure()
-    years = list(range(2024, 2036))
-    threat = [10 + (i**2)/3 for i in range(len(years))]
-    threat = [min(100, t) for t in threat]
-    
-    fig.add_trace(go.Scatter(x=years, y=threat, fill='tozeroy', 
-        line=dict(color='#9d4edd', width=3), fillcolor='rgba(157,78,221,0.2)'))
-    fig.add_vline(x=2030, line_dash="dash", line_color="#ff4444", annotation_text="CRQC")
-    fig.update_layout(template="plotly_dark", paper_bgcolor='rgba(0,0,0,0)', 
-        plot_bgcolor='rgba(0,0,0,0)', height=300, xaxis_title="Year", yaxis_title="Threat %")
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_timeline_fig(), use_container_width=True, key="threat_timeline")
 
 else:
     # Results
@@ -1521,6 +1662,9 @@ else:
     mode = st.session_state.current_scan_mode
     target = st.session_state.current_target
     m = MODES[mode]
+    frames = st.session_state.audit_frames
+    if frames is None:
+        frames = st.session_state.audit_frames = _audit_frames(df, m['specs']['quantum'])
     
     # Mode badge
     st.markdown(f"""
@@ -1530,94 +1674,73 @@ else:
     """, unsafe_allow_html=True)
     
     # Metrics
-    total = len(df)
-    critical = len(df[df['Quantum_Risk'].str.contains('Critical', na=False)])
-    high = len(df[df['Quantum_Risk'].str.contains('High', na=False)])
-    qv = len(df[df['quantum_years_vulnerable'] <= 5]) if 'quantum_years_vulnerable' in df.columns and m['specs']['quantum'] else 0
-    avg = df['Risk_Score'].mean()
+    summary = _risk_summary(df, _fingerprint(df), m['specs']['quantum'])
     
     cols = st.columns(5)
-    cols[0].metric("🎯 Assets", total)
-    cols[1].metric("🔴 Critical", critical)
-    cols[2].metric("🟠 High", high)
-    cols[3].metric("⚛️ Quantum", qv if m['specs']['quantum'] else "N/A")
-    cols[4].metric("📊 Avg Risk", f"{avg:.0f}")
+    cols[0].metric("🎯 Assets", summary['total'])
+    cols[1].metric("🔴 Critical", summary['critical'])
+    cols[2].metric("🟠 High", summary['high'])
+    cols[3].metric("⚛️ Quantum", summary['quantum'] if m['specs']['quantum'] else "N/A")
+    cols[4].metric("📊 Avg Risk", f"{summary['avg']:.0f}")
     
     st.markdown("---")
     
-    # Tabs based on mode
-    if mode == "Comprehensive Audit":
-        tabs = st.tabs(["📊 Intelligence", "⚛️ Shor's Algorithm", "🔍 Grover's Algorithm", 
-                       "🗺️ Threat Radar", "📋 ISMS Framework", "💰 Budget Calculator", "📥 Export"])
-    elif mode in ["Deep Quantum Analysis", "Stealth Mode"]:
-        tabs = st.tabs(["📊 Intelligence", "⚛️ Shor's Algorithm", "🔍 Grover's Algorithm", 
-                       "🗺️ Threat Radar", "📥 Export"])
-    else:
-        tabs = st.tabs(["📊 Intelligence", "🗺️ Threat Radar", "📥 Export"])
-    
-    idx = 0
+    # Views based on mode; only the selected view's body runs on a rerun.
+    # Keying the selector per mode keeps each layout's last view stable
+    # when switching between modes.
+    views = m["views"]
+    selected = st.radio("View", views, horizontal=True, label_visibility="collapsed",
+                        key=f"active_tab_{mode}")
     
-    # Intelligence
-    with tabs[idx]:
+    if selected == "📊 Intelligence":
         st.markdown("### 📊 Threat Intelligence Matrix")
-        cols = ['asset', 'ip', 'country', 'criticality', 'Quantum_Risk', 'Risk_Score']
-        if m['specs']['quantum']:
-            cols += ['quantum_years_vulnerable', 'PQC_Migration', 'PQC_Priority']
-        st.dataframe(df[cols], use_container_width=True, height=400)
-    idx += 1
-    
-    # Shor's
-    if m['specs']['quantum']:
-        with tabs[idx]:
-            render_shors_deep_dive(df)
-        idx += 1
-        
-        # Grover's
-        with tabs[idx]:
-            render_grovers_analysis()
-        idx += 1
-    
-    # Threat Radar
-    with tabs[idx]:
-        render_threat_radar_explained(df)
-    idx += 1
-    
-    # ISMS (Comprehensive)
-    if mode == "Comprehensive Audit":
-        with tabs[idx]:
-            render_isms_framework(df, target)
-        idx += 1
-        
-        # Budget
-        with tabs[idx]:
-            render_budget_calculator(df, target)
-        idx += 1
+        st.dataframe(
+            frames['intel'],
+            use_container_width=True,
+            height=400,
+            hide_index=True,
+            column_config=INTEL_COLUMN_CONFIG,
+        )
+    
+    elif selected == "⚛️ Shor's Algorithm":
+        render_shors_deep_dive(df)
+    
+    elif selected == "🔍 Grover's Algorithm":
+        render_grovers_analysis()
+    
+    elif selected == "🗺️ Threat Radar":
+        render_threat_radar_explained(frames['map'], frames['geo'], mode)
+    
+    elif selected == "📋 ISMS Framework":
+        render_isms_framework(df, target)
+    
+    elif selected == "💰 Budget Calculator":
+        render_budget_calculator(df, target)
     
-    # Export
-    with tabs[idx]:
+    elif selected == "📥 Export":
         st.markdown("### 📥 Export Reports")
         
         cols = st.columns(4 if mode == "Comprehensive Audit" else 3)
         
         with cols[0]:
             st.markdown("#### 📄 PDF Report")
-            pdf = generate_pdf_report(df, target, mode)
+            pdf = _cached_pdf_report(df, _fingerprint(df), target, mode)
             st.download_button("Download PDF", pdf, f"Sentinel_{target}.pdf", "application/pdf", use_container_width=True)
         
         with cols[1]:
             st.markdown("#### 📊 CSV Data")
-            csv = df.to_csv(index=False).encode()
+            csv = _cached_csv(df, _fingerprint(df))
             st.download_button("Download CSV", csv, f"Sentinel_{target}.csv", "text/csv", use_container_width=True)
         
         with cols[2]:
             st.markdown("#### 🔗 JSON")
-            js = df.to_json(orient='records', indent=2)
+            js = _cached_json(df, _fingerprint(df))
             st.download_button("Download JSON", js, f"Sentinel_{target}.json", "application/json", use_container_width=True)
         
         if mode == "Comprehensive Audit":
             with cols[3]:
                 st.markdown("#### 📋 ISMS Framework")
-                isms = generate_full_isms_pdf(df, target, mode)
+                isms = _cached_isms_pdf(df, _fingerprint(df), target, mode)
                 st.download_button("Download ISMS PDF", isms, f"ISMS_{target}.pdf", "application/pdf", use_container_width=True)
 
 # Footer
@@ -6,16 +6,99 @@ FIXED: Scan modes NOW ACTUALLY WORK DIFFERENTLY
 import asyncio
 import aiohttp
 import socket
+import numpy as np
 import pandas as pd
-from fpdf import FPDF
 from datetime import datetime
 import ssl
 import certifi
 from typing import Dict, List, Optional, Callable
 import hashlib
 import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 
+# Blocking DNS lookups and TLS handshakes run on these pools rather than on
+# the event loop; both are shared by every audit running in the process.
+# Handshakes get their own pool so slow or hanging hosts can't starve DNS.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="sentinel-io")
+_TLS_EXECUTOR = ThreadPoolExecutor(max_workers=20, thread_name_prefix="sentinel-tls")
+
+
+# Resolved host -> (expiry, ip); failures are remembered briefly as None so
+# a dead name isn't re-resolved (and re-timed-out) by every probe of the scan
+_DNS_TTL = 300.0
+_DNS_NEGATIVE_TTL = 30.0
+_DNS_CACHE_MAX = 4096
+_DNS_CACHE: Dict[str, tuple] = {}
+
+
+async def _resolve(host: str) -> Optional[str]:
+    """gethostbyname on the I/O pool, behind a short-lived per-host cache"""
+    now = time.monotonic()
+    cached = _DNS_CACHE.get(host)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    if len(_DNS_CACHE) > _DNS_CACHE_MAX:
+        for key, (expiry, _) in list(_DNS_CACHE.items()):
+            if expiry <= now:
+                _DNS_CACHE.pop(key, None)
+    loop = asyncio.get_running_loop()
+    try:
+        ip = await asyncio.wait_for(
+            loop.run_in_executor(_IO_EXECUTOR, socket.gethostbyname, host),
+            timeout=5.0
+        )
+        _DNS_CACHE[host] = (now + _DNS_TTL, ip)
+    except (OSError, UnicodeError, asyncio.TimeoutError):
+        # UnicodeError: IDNA rejects empty or over-long labels ("a..b.com")
+        ip = None
+        _DNS_CACHE[host] = (now + _DNS_NEGATIVE_TTL, None)
+    return ip
+
+
+@lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """Process-wide client TLS context; the CA bundle is parsed only once"""
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+# Every mode-specific Quantum_Risk label collapses onto one of these tiers
+RISK_TIERS = ("Critical", "High", "Medium", "Low")
+
+
+def risk_tier(risk_level: str) -> str:
+    """Map a Quantum_Risk label (e.g. 'Critical (HNDL)', 'Medium Risk') to its tier"""
+    if 'Critical' in risk_level:
+        return "Critical"
+    if 'High' in risk_level:
+        return "High"
+    if 'Medium' in risk_level or 'Moderate' in risk_level:
+        return "Medium"
+    return "Low"
+
+
+def risk_counts(df: pd.DataFrame) -> Dict[str, int]:
+    """Asset count per tier, in RISK_TIERS order"""
+    if 'risk_tier' not in df.columns:
+        return dict.fromkeys(RISK_TIERS, 0)
+    counts = df['risk_tier'].value_counts()
+    return {tier: int(counts.get(tier, 0)) for tier in RISK_TIERS}
+
+
+
+# Column order of the intelligence frame: the per-asset record built in
+# SentinelAgent._analyze_asset plus the columns added in build_intelligence
+INTEL_COLUMNS = (
+    "asset", "asset_id", "ip", "lat", "lon", "country", "city", "isp", "timezone",
+    "ssl_valid", "ssl_version", "ssl_cipher", "quantum_safe_crypto",
+    "criticality", "Quantum_Risk", "risk_tier", "Risk_Score",
+    "quantum_threat_algorithm", "quantum_years_vulnerable", "quantum_urgency",
+    "PQC_Migration", "PQC_Signature", "PQC_Priority", "PQC_Timeline",
+    "Solution", "color", "timestamp", "harvest_now_threat", "scan_mode",
+)
+
 class ScanMode:
     """Scan mode configurations - EACH MODE BEHAVES DIFFERENTLY"""
     
@@ -34,6 +117,7 @@ class ScanMode:
                 "enable_ssl_check": True,
                 "enable_geo": True,
                 "delay_between_requests": 0,  # Fast - no delays
+                "max_concurrency": 8,  # Parallel asset analysis
                 "subdomain_sources": ["common"],  # Only common subdomains
                 "use_crt_sh": False,  # Skip certificate transparency
                 "description": "Fast reconnaissance - basic asset discovery",
@@ -46,6 +130,7 @@ class ScanMode:
                 "enable_ssl_check": True,
                 "enable_geo": True,
                 "delay_between_requests": 0.3,  # Slight delay
+                "max_concurrency": 4,  # Parallel asset analysis
                 "subdomain_sources": ["crt.sh", "common"],
                 "use_crt_sh": True,  # Use certificate transparency
                 "description": "Full quantum threat assessment with PQC recommendations",
@@ -58,6 +143,7 @@ class ScanMode:
                 "enable_ssl_check": True,
                 "enable_geo": True,
                 "delay_between_requests": 2.0,  # SLOW - 2 second delays
+                "max_concurrency": 1,  # One asset at a time
                 "subdomain_sources": ["common"],  # Passive only - no crt.sh
                 "use_crt_sh": False,  # Skip to avoid detection
                 "description": "Low-profile scan with delays to avoid detection",
@@ -70,6 +156,7 @@ class ScanMode:
                 "enable_ssl_check": True,
                 "enable_geo": True,
                 "delay_between_requests": 0.2,
+                "max_concurrency": 6,  # Parallel asset analysis
                 "subdomain_sources": ["crt.sh", "common", "extended"],
                 "use_crt_sh": True,
                 "description": "Full audit - recon + quantum + compliance + ISMS",
@@ -80,6 +167,114 @@ class ScanMode:
         return configs.get(mode, configs["Standard Recon"])
 
 
+@lru_cache(maxsize=32)
+def _crypto_vulnerability(crypto_type: str, key_size: int, current_year: int) -> Dict:
+    """Quantum vulnerability of a crypto system as of current_year.
+    
+    Pure in its arguments, so every asset in a scan shares one entry.
+    """
+    vulnerability_map = {
+        'RSA': {
+            'algorithm_threat': 'Shor',
+            'quantum_speedup': 'Exponential',
+            'vulnerability_year': 2030 if key_size <= 2048 else 2032,
+            'severity': 'CRITICAL'
+        },
+        'ECC': {
+            'algorithm_threat': 'Shor',
+            'quantum_speedup': 'Exponential',
+            'vulnerability_year': 2030,
+            'severity': 'CRITICAL'
+        },
+        'AES': {
+            'algorithm_threat': 'Grover',
+            'quantum_speedup': 'Quadratic',
+            'vulnerability_year': 2040,
+            'severity': 'MODERATE'
+        },
+        'SHA': {
+            'algorithm_threat': 'Grover',
+            'quantum_speedup': 'Quadratic',
+            'vulnerability_year': 2040,
+            'severity': 'LOW'
+        }
+    }
+    
+    if key_size >= 1024:
+        crypto_category = 'RSA'
+    else:
+        crypto_category = crypto_type
+    
+    threat_info = vulnerability_map.get(crypto_category, vulnerability_map['RSA'])
+    years_until_vulnerable = max(0, threat_info['vulnerability_year'] - current_year)
+    
+    if years_until_vulnerable <= 3:
+        risk_score = 95
+        urgency = 'IMMEDIATE'
+    elif years_until_vulnerable <= 5:
+        risk_score = 85
+        urgency = 'URGENT'
+    elif years_until_vulnerable <= 7:
+        risk_score = 70
+        urgency = 'HIGH'
+    else:
+        risk_score = 50
+        urgency = 'MODERATE'
+    
+    return {
+        'crypto_type': crypto_category,
+        'key_size': key_size,
+        'threat_algorithm': threat_info['algorithm_threat'],
+        'quantum_speedup': threat_info['quantum_speedup'],
+        'years_until_vulnerable': years_until_vulnerable,
+        'vulnerability_year': threat_info['vulnerability_year'],
+        'quantum_risk_score': risk_score,
+        'urgency': urgency,
+        'severity': threat_info['severity']
+    }
+
+
+@lru_cache(maxsize=8)
+def _pqc_recommendation(criticality: str) -> Dict:
+    """PQC algorithm set for a criticality level"""
+    recommendations = {
+        'CRITICAL': {
+            'key_encapsulation': 'ML-KEM-1024',
+            'digital_signature': 'ML-DSA-87',
+            'hash': 'SHA-3-512',
+            'migration_priority': 'P0 - Immediate',
+            'timeline': '0-3 months'
+        },
+        'HIGH': {
+            'key_encapsulation': 'ML-KEM-768',
+            'digital_signature': 'ML-DSA-65',
+            'hash': 'SHA-3-256',
+            'migration_priority': 'P1 - Urgent',
+            'timeline': '3-6 months'
+        },
+        'MODERATE': {
+            'key_encapsulation': 'ML-KEM-512',
+            'digital_signature': 'ML-DSA-44',
+            'hash': 'SHA-3-256',
+            'migration_priority': 'P2 - Standard',
+            'timeline': '6-12 months'
+        }
+    }
+    
+    recommendation = recommendations.get(criticality, recommendations['MODERATE'])
+    
+    return {
+        'criticality': criticality,
+        'recommended_kem': recommendation['key_encapsulation'],
+        'recommended_signature': recommendation['digital_signature'],
+        'recommended_hash': recommendation['hash'],
+        'migration_priority': recommendation['migration_priority'],
+        'timeline': recommendation['timeline'],
+        'hybrid_mode': 'Combine with classical crypto during transition',
+        'nist_standard': 'FIPS 203, 204, 205'
+    }
+
+
 class QuantumThreatAnalyzer:
     """Quantum computing threat assessment for cryptographic assets"""
     
@@ -93,114 +288,55 @@ class QuantumThreatAnalyzer:
     
     def assess_crypto_vulnerability(self, crypto_type: str, key_size: int = 2048) -> Dict:
         """Assess quantum vulnerability of cryptographic system"""
-        current_year = datetime.now().year
-        
-        vulnerability_map = {
-            'RSA': {
-                'algorithm_threat': 'Shor',
-                'quantum_speedup': 'Exponential',
-                'vulnerability_year': 2030 if key_size <= 2048 else 2032,
-                'severity': 'CRITICAL'
-            },
-            'ECC': {
-                'algorithm_threat': 'Shor',
-                'quantum_speedup': 'Exponential',
-                'vulnerability_year': 2030,
-                'severity': 'CRITICAL'
-            },
-            'AES': {
-                'algorithm_threat': 'Grover',
-                'quantum_speedup': 'Quadratic',
-                'vulnerability_year': 2040,
-                'severity': 'MODERATE'
-            },
-            'SHA': {
-                'algorithm_threat': 'Grover',
-                'quantum_speedup': 'Quadratic',
-                'vulnerability_year': 2040,
-                'severity': 'LOW'
-            }
-        }
-        
-        if key_size >= 1024:
-            crypto_category = 'RSA'
-        else:
-            crypto_category = crypto_type
-        
-        threat_info = vulnerability_map.get(crypto_category, vulnerability_map['RSA'])
-        years_until_vulnerable = max(0, threat_info['vulnerability_year'] - current_year)
-        
-        if years_until_vulnerable <= 3:
-            risk_score = 95
-            urgency = 'IMMEDIATE'
-        elif years_until_vulnerable <= 5:
-            risk_score = 85
-            urgency = 'URGENT'
-        elif years_until_vulnerable <= 7:
-            risk_score = 70
-            urgency = 'HIGH'
-        else:
-            risk_score = 50
-            urgency = 'MODERATE'
-        
-        return {
-            'crypto_type': crypto_category,
-            'key_size': key_size,
-            'threat_algorithm': threat_info['algorithm_threat'],
-            'quantum_speedup': threat_info['quantum_speedup'],
-            'years_until_vulnerable': years_until_vulnerable,
-            'vulnerability_year': threat_info['vulnerability_year'],
-            'quantum_risk_score': risk_score,
-            'urgency': urgency,
-            'severity': threat_info['severity']
-        }
+        return dict(_crypto_vulnerability(crypto_type, key_size, datetime.now().year))
     
     def recommend_pqc_algorithm(self, asset_type: str, criticality: str) -> Dict:
         """Recommend Post-Quantum Cryptography algorithm"""
-        recommendations = {
-            'CRITICAL': {
-                'key_encapsulation': 'ML-KEM-1024',
-                'digital_signature': 'ML-DSA-87',
-                'hash': 'SHA-3-512',
-                'migration_priority': 'P0 - Immediate',
-                'timeline': '0-3 months'
-            },
-            'HIGH': {
-                'key_encapsulation': 'ML-KEM-768',
-                'digital_signature': 'ML-DSA-65',
-                'hash': 'SHA-3-256',
-                'migration_priority': 'P1 - Urgent',
-                'timeline': '3-6 months'
-            },
-            'MODERATE': {
-                'key_encapsulation': 'ML-KEM-512',
-                'digital_signature': 'ML-DSA-44',
-                'hash': 'SHA-3-256',
-                'migration_priority': 'P2 - Standard',
-                'timeline': '6-12 months'
-            }
-        }
-        
-        recommendation = recommendations.get(criticality, recommendations['MODERATE'])
-        
-        return {
-            'criticality': criticality,
-            'recommended_kem': recommendation['key_encapsulation'],
-            'recommended_signature': recommendation['digital_signature'],
-            'recommended_hash': recommendation['hash'],
-            'migration_priority': recommendation['migration_priority'],
-            'timeline': recommendation['timeline'],
-            'hybrid_mode': 'Combine with classical crypto during transition',
-            'nist_standard': 'FIPS 203, 204, 205'
-        }
+        # The recommendation depends on criticality alone
+        return dict(_pqc_recommendation(criticality))
+
+
+class CircuitBreaker:
+    """Skip a failing backend for a cooldown after consecutive failures"""
+    
+    def __init__(self, threshold: int = 3, cooldown: float = 30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = 0.0
+    
+    def is_open(self) -> bool:
+        """True while tripped; after the cooldown one trial call is let through"""
+        if self.failures < self.threshold:
+            return False
+        now = time.monotonic()
+        if now - self.opened_at < self.cooldown:
+            return True
+        # Half-open: this caller is the trial, everyone else waits out another
+        # cooldown unless it succeeds and reset() closes the breaker
+        self.opened_at = now
+        return False
+    
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+    
+    def reset(self):
+        self.failures = 0
 
 
 class SentinelAgent:
     """Autonomous reconnaissance agent with quantum threat intelligence"""
     
     def __init__(self, domain: str, scan_mode: str = "Deep Quantum Analysis"):
-        self.domain = domain
+        # Host names are case-insensitive; crt.sh returns them lower-cased
+        self.domain = domain.strip().lower().rstrip('.')
         self.session = None
+        self._geo_prefetch: Dict[str, Dict] = {}
+        # Stop paying timeouts to a geo backend once it keeps failing
+        self._ip_api_breaker = CircuitBreaker()
+        self._ipapi_co_breaker = CircuitBreaker()
         self.scan_mode = scan_mode
         self.config = ScanMode.get_config(scan_mode)
         
@@ -214,11 +350,12 @@ class SentinelAgent:
         print(f"[SENTINEL] Quantum Analysis: {'ENABLED' if self.config['enable_quantum'] else 'DISABLED'}")
         print(f"[SENTINEL] Max Assets: {self.config['max_assets']}")
         print(f"[SENTINEL] Request Delay: {self.config['delay_between_requests']}s")
+        print(f"[SENTINEL] Concurrency: {self.config['max_concurrency']}")
         
     async def __aenter__(self):
         """Context manager for proper session handling"""
         timeout = aiohttp.ClientTimeout(total=self.config['timeout'])
-        connector = aiohttp.TCPConnector(limit=10, limit_per_host=5)
+        connector = aiohttp.TCPConnector(limit=10, limit_per_host=5, ssl=_ssl_context())
         self.session = aiohttp.ClientSession(timeout=timeout, connector=connector)
         return self
         
@@ -240,65 +377,105 @@ class SentinelAgent:
         if not self.config['enable_geo']:
             return self._default_geo()
         
-        # Apply stealth delay
-        await self._apply_stealth_delay()
-            
         try:
-            loop = asyncio.get_event_loop()
-            ip = await asyncio.wait_for(
-                loop.run_in_executor(None, socket.gethostbyname, asset),
-                timeout=5.0
-            )
+            ip = await _resolve(asset)
+            if ip is None:
+                raise socket.gaierror(f"cannot resolve {asset}")
             
-            # Try primary geo API
-            try:
-                async with self.session.get(
-                    f"http://ip-api.com/json/{ip}",
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if data.get("status") == "success":
+            # Already located by the batch lookup in build_intelligence
+            if ip in self._geo_prefetch:
+                return self._geo_prefetch[ip]
+            
+            # Try primary geo API, unless it has been failing
+            if not self._ip_api_breaker.is_open():
+                await self._apply_stealth_delay()
+                try:
+                    async with self.session.get(
+                        f"http://ip-api.com/json/{ip}",
+                        timeout=aiohttp.ClientTimeout(total=10)
+                    ) as resp:
+                        if resp.status == 200:
+                            self._ip_api_breaker.reset()
+                            data = await resp.json()
+                            if data.get("status") == "success":
+                                return self._ip_api_geo(data, ip)
+                        else:
+                            self._ip_api_breaker.record_failure()
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    print(f"[GEO] ip-api.com failed for {asset}")
+                    self._ip_api_breaker.record_failure()
+                
+            # Fallback to ipapi.co
+            if not self._ipapi_co_breaker.is_open():
+                await self._apply_stealth_delay()
+                try:
+                    async with self.session.get(
+                        f"https://ipapi.co/{ip}/json/",
+                        timeout=aiohttp.ClientTimeout(total=10)
+                    ) as resp:
+                        if resp.status == 200:
+                            self._ipapi_co_breaker.reset()
+                            data = await resp.json()
                             return {
-                                "lat": data.get("lat", 0.0),
-                                "lon": data.get("lon", 0.0),
-                                "country": data.get("country", "Unknown"),
+                                "lat": data.get("latitude", 0.0),
+                                "lon": data.get("longitude", 0.0),
+                                "country": data.get("country_name", "Unknown"),
                                 "city": data.get("city", "Unknown"),
-                                "isp": data.get("isp", "Unknown"),
+                                "isp": data.get("org", "Unknown"),
                                 "ip": ip,
                                 "timezone": data.get("timezone", "Unknown"),
                                 "resolved": True
                             }
-            except asyncio.TimeoutError:
-                print(f"[GEO] Timeout for {asset}")
-                
-            # Fallback to ipapi.co
-            try:
-                await self._apply_stealth_delay()
-                async with self.session.get(
-                    f"https://ipapi.co/{ip}/json/",
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return {
-                            "lat": data.get("latitude", 0.0),
-                            "lon": data.get("longitude", 0.0),
-                            "country": data.get("country_name", "Unknown"),
-                            "city": data.get("city", "Unknown"),
-                            "isp": data.get("org", "Unknown"),
-                            "ip": ip,
-                            "timezone": data.get("timezone", "Unknown"),
-                            "resolved": True
-                        }
-            except:
-                pass
+                        self._ipapi_co_breaker.record_failure()
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    print(f"[GEO] ipapi.co failed for {asset}")
+                    self._ipapi_co_breaker.record_failure()
                 
         except (socket.gaierror, asyncio.TimeoutError, Exception) as e:
             print(f"[GEO] Failed for {asset}: {str(e)[:50]}")
         
         return self._default_geo()
     
+    async def _batch_geo(self, ips: List[str]) -> Dict[str, Dict]:
+        """Geolocate many IPs through ip-api.com's batch endpoint, 100 per request"""
+        geo = {}
+        for start in range(0, len(ips), 100):
+            if self._ip_api_breaker.is_open():
+                break
+            await self._apply_stealth_delay()
+            try:
+                async with self.session.post(
+                    "http://ip-api.com/batch",
+                    json=[{"query": ip} for ip in ips[start:start + 100]],
+                    timeout=aiohttp.ClientTimeout(total=10)
+                ) as resp:
+                    if resp.status == 200:
+                        self._ip_api_breaker.reset()
+                        for data in await resp.json():
+                            if data.get("status") == "success":
+                                geo[data["query"]] = self._ip_api_geo(data, data["query"])
+                    else:
+                        self._ip_api_breaker.record_failure()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"[GEO] Batch lookup failed: {str(e)[:50]}")
+                self._ip_api_breaker.record_failure()
+        print(f"[GEO] Batch located {len(geo)}/{len(ips)} IPs")
+        return geo
+    
+    @staticmethod
+    def _ip_api_geo(data: Dict, ip: str) -> Dict:
+        """Geo record from an ip-api.com response entry"""
+        return {
+            "lat": data.get("lat", 0.0),
+            "lon": data.get("lon", 0.0),
+            "country": data.get("country", "Unknown"),
+            "city": data.get("city", "Unknown"),
+            "isp": data.get("isp", "Unknown"),
+            "ip": ip,
+            "timezone": data.get("timezone", "Unknown"),
+            "resolved": True
+        }
+    
     def _default_geo(self) -> Dict:
         """Return default geo data"""
         return {
@@ -381,12 +558,32 @@ class SentinelAgent:
                 discovered_assets.add(f"{sub}.{self.domain}")
             print(f"[RECON] Added {len(extended_subdomains)} extended subdomains")
         
+        # Drop candidates that don't resolve before they cost a geo lookup
+        # and a TLS handshake each; the lookups also warm the DNS cache
+        # that build_intelligence reads from
+        # Paced like every other request: the mode's concurrency cap, and
+        # in Stealth Mode one lookup at a time with its delay
+        candidates = sorted(discovered_assets - {self.domain})
+        semaphore = asyncio.Semaphore(self.config['max_concurrency'])
+        
+        async def probe(host: str) -> Optional[str]:
+            async with semaphore:
+                await self._apply_stealth_delay()
+                try:
+                    return host if await _resolve(host) else None
+                except Exception:
+                    return None
+        
+        probed = await asyncio.gather(*(probe(host) for host in candidates))
+        live = [host for host in probed if host]
+        print(f"[RECON] {len(live)}/{len(candidates)} subdomains resolve")
+        
         # Always include root domain
-        discovered_assets.add(self.domain)
+        live.append(self.domain)
         
         # Limit based on scan mode
         max_assets = self.config['max_assets']
-        result = sorted(list(discovered_assets))[:max_assets]
+        result = sorted(live)[:max_assets]
         
         print(f"[RECON] Total: {len(discovered_assets)} discovered, returning {len(result)} (max: {max_assets})")
         
@@ -395,16 +592,27 @@ class SentinelAgent:
     async def check_ssl_cert(self, asset: str) -> Dict:
         """Check SSL certificate - with stealth delays"""
         if not self.config['enable_ssl_check']:
-            return {'valid': False, 'issuer': 'N/A', 'version': 'N/A', 'cipher': 'Unknown', 'quantum_safe': False}
+            return self._default_ssl()
         
         await self._apply_stealth_delay()
             
         try:
-            context = ssl.create_default_context(cafile=certifi.where())
-            loop = asyncio.get_event_loop()
+            context = _ssl_context()
+            loop = asyncio.get_running_loop()
+            ip = await _resolve(asset)
+            
+            def connect():
+                # The cached IPv4 address first; the host name covers IPv6-only
+                # and multi-address hosts, trying each address in turn
+                if ip is not None:
+                    try:
+                        return socket.create_connection((ip, 443), timeout=5)
+                    except OSError:
+                        pass
+                return socket.create_connection((asset, 443), timeout=5)
             
             def check_cert():
-                with socket.create_connection((asset, 443), timeout=5) as sock:
+                with connect() as sock:
                     with context.wrap_socket(sock, server_hostname=asset) as ssock:
                         cert = ssock.getpeercert()
                         cipher = ssock.cipher()
@@ -422,50 +630,143 @@ class SentinelAgent:
                         }
             
             result = await asyncio.wait_for(
-                loop.run_in_executor(None, check_cert),
+                loop.run_in_executor(_TLS_EXECUTOR, check_cert),
                 timeout=10.0
             )
             return result
         except Exception as e:
-            return {
-                'valid': False,
-                'issuer': 'N/A',
-                'version': 'N/A',
-                'cipher': 'Unknown',
-                'quantum_safe': False
-            }
+            return self._default_ssl()
+    
+    def _default_ssl(self) -> Dict:
+        """Return default SSL data"""
+        return {
+            'valid': False,
+            'issuer': 'N/A',
+            'version': 'N/A',
+            'cipher': 'Unknown',
+            'quantum_safe': False
+        }
 
     async def build_intelligence(self, assets: List[str], progress_callback: Optional[Callable] = None) -> pd.DataFrame:
         """Build intelligence with MODE-SPECIFIC analysis"""
-        results = []
+        # One row per asset, whatever the caller passed in
+        assets = list(dict.fromkeys(assets))
+        
+        # Resolve every asset up front and geolocate the IPs in one batch;
+        # get_geo_data only goes to the per-IP endpoints for misses
+        if self.config['enable_geo'] and assets:
+            ips = await asyncio.gather(*(_resolve(asset) for asset in assets))
+            self._geo_prefetch = await self._batch_geo(sorted({ip for ip in ips if ip}))
+        
+        # 12-hex-char fingerprints straight from blake2b's digest_size,
+        # computed once here rather than inside every task
+        asset_ids = {asset: hashlib.blake2b(asset.encode(), digest_size=6).hexdigest() for asset in assets}
+        
+        # The whole scan is stamped with its start time
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
         total = len(assets)
+        done = 0
+        # Assets are independent; the mode caps how many are in flight
+        semaphore = asyncio.Semaphore(self.config['max_concurrency'])
         
         print(f"[INTEL] Analyzing {total} assets in {self.scan_mode} mode...")
         
-        for idx, asset in enumerate(assets):
-            try:
-                print(f"[INTEL] [{idx+1}/{total}] Analyzing {asset}...")
-                data = await self._analyze_asset(asset)
-                if isinstance(data, dict):
-                    results.append(data)
-                    
-                if progress_callback:
-                    progress_callback(idx + 1, total, asset)
-                    
-            except Exception as e:
-                print(f"[INTEL] Error analyzing {asset}: {e}")
+        async def analyze(idx: int, asset: str) -> Optional[Dict]:
+            nonlocal done
+            data = None
+            async with semaphore:
+                try:
+                    print(f"[INTEL] [{idx+1}/{total}] Analyzing {asset}...")
+                    data = await self._analyze_asset(asset, asset_ids[asset])
+                except Exception as e:
+                    print(f"[INTEL] Error analyzing {asset}: {e}")
+            done += 1
+            if progress_callback:
+                progress_callback(done, total, asset)
+            return data
+        
+        analyzed = await asyncio.gather(*(analyze(idx, asset) for idx, asset in enumerate(assets)))
+        results = [data for data in analyzed if isinstance(data, dict)]
         
         print(f"[INTEL] Analysis complete. {len(results)} assets processed.")
-        return pd.DataFrame(results)
+        df = pd.DataFrame.from_records(results)
+        if not df.empty:
+            self._score_assets(df)
+            df['timestamp'] = timestamp
+        return df.reindex(columns=list(INTEL_COLUMNS))
     
-    async def _analyze_asset(self, asset: str) -> Dict:
-        """Analyze individual asset with MODE-SPECIFIC behavior"""
+    def _score_assets(self, df: pd.DataFrame) -> None:
+        """Add Risk_Score, Quantum_Risk, risk_tier, color and Solution in place.
         
-        # Get geolocation data
-        geo_data = await self.get_geo_data(asset)
+        Works column-wise over the whole frame instead of branching per asset
+        in _analyze_asset; thresholds depend on whether quantum analysis is on.
+        """
+        quantum = self.config['enable_quantum']
+        ssl_valid = df['ssl_valid'].astype(bool).to_numpy()
+        quantum_safe = df['quantum_safe_crypto'].astype(bool).to_numpy()
+        criticality = df['criticality'].to_numpy()
+        
+        # Criticality (40 max), SSL/TLS (20 max), quantum exposure (30 max,
+        # quantum modes only) and unresolved geolocation (10)
+        score = np.select([criticality == 'CRITICAL', criticality == 'HIGH'], [40, 25], default=15)
+        score += np.where(~ssl_valid, 20, np.where(~quantum_safe, 10, 0))
+        if quantum:
+            years = df['quantum_years_vulnerable'].to_numpy()
+            score += np.select([years <= 4, years <= 6], [30, 20], default=10)
+        score += np.where(df['geo_resolved'].astype(bool).to_numpy(), 0, 10)
+        
+        # Mode multiplier, truncated like int() and capped at 100
+        score = np.minimum((score * self.config['risk_multiplier']).astype(int), 100)
+        df['Risk_Score'] = score
+        
+        if quantum:
+            bands = [score >= 80, score >= 60, score >= 40]
+            labels = ["Critical (HNDL)", "High - Quantum Vulnerable", "Moderate"]
+            lowest = "Low"
+        else:
+            bands = [score >= 70, score >= 50, score >= 30]
+            labels = ["High Risk", "Medium Risk", "Low Risk"]
+            lowest = "Minimal"
+        df['Quantum_Risk'] = np.select(bands, labels, default=lowest)
+        df['color'] = np.select(bands, ["red", "orange", "yellow"], default="blue")
+        df['risk_tier'] = df['Quantum_Risk'].map({label: risk_tier(label) for label in labels + [lowest]})
+        
+        # Each remediation contributes "<text> | " where it applies; the
+        # trailing separator is trimmed once at the end
+        if quantum:
+            migrate = df['quantum_urgency'].isin(('IMMEDIATE', 'URGENT')).to_numpy()
+            parts = [
+                np.where(migrate, "QUANTUM: Migrate to " + df['PQC_Migration'].astype(str) + " | ", ""),
+                np.where(~ssl_valid, "Deploy SSL/TLS | ", ""),
+                np.where(~quantum_safe, "Enable PQC hybrid mode | ", ""),
+            ]
+        else:
+            parts = [
+                np.where(~ssl_valid, "Deploy SSL certificate | ", ""),
+                np.where(criticality == 'CRITICAL', "Review access controls | ", ""),
+            ]
+        solution = pd.Series(parts[0], index=df.index, dtype=object)
+        for part in parts[1:]:
+            solution = solution + part
+        solution = solution.str[:-3]
+        df['Solution'] = solution.mask(solution == "", "Continue monitoring")
+    
+    async def _analyze_asset(self, asset: str, asset_id: str) -> Dict:
+        """Analyze individual asset with MODE-SPECIFIC behavior"""
         
-        # Check SSL certificate
-        ssl_data = await self.check_ssl_cert(asset)
+        # Geolocation and the SSL check are independent; run them together,
+        # except in delayed modes which promise one request at a time
+        if self.config['delay_between_requests'] > 0:
+            geo_data, ssl_data = await self.get_geo_data(asset), await self.check_ssl_cert(asset)
+        else:
+            geo_data, ssl_data = await asyncio.gather(
+                self.get_geo_data(asset), self.check_ssl_cert(asset), return_exceptions=True
+            )
+        if isinstance(geo_data, Exception):
+            geo_data = self._default_geo()
+        if isinstance(ssl_data, Exception):
+            ssl_data = self._default_ssl()
         
         # Determine criticality based on naming patterns
         critical_keywords = ["vault", "api", "pqc", "secure", "admin", "gateway", "quantum", "keys", "auth", "iam", "sso", "identity", "crypto"]
@@ -512,107 +813,9 @@ class SentinelAgent:
             pqc_timeline = 'N/A'
             harvest_now_threat = False
         
-        # ================================================================
-        # RISK SCORE CALCULATION (Mode-specific)
-        # ================================================================
-        
-        risk_score = 0
-        
-        # Factor 1: Criticality (40 points max)
-        if criticality == 'CRITICAL':
-            risk_score += 40
-        elif criticality == 'HIGH':
-            risk_score += 25
-        else:
-            risk_score += 15
-        
-        # Factor 2: SSL/TLS Status (20 points max)
-        if not ssl_data.get('valid', False):
-            risk_score += 20
-        elif not ssl_data.get('quantum_safe', False):
-            risk_score += 10
-        
-        # Factor 3: Quantum vulnerability (30 points max) - ONLY if quantum enabled
-        if self.config['enable_quantum']:
-            if quantum_years_vulnerable <= 4:
-                risk_score += 30
-            elif quantum_years_vulnerable <= 6:
-                risk_score += 20
-            else:
-                risk_score += 10
-        
-        # Factor 4: Geolocation resolved (10 points)
-        if not geo_data.get('resolved', False):
-            risk_score += 10
-        
-        # Apply mode-specific risk multiplier
-        risk_score = int(risk_score * self.config['risk_multiplier'])
-        risk_score = min(100, risk_score)  # Cap at 100
-        
-        # ================================================================
-        # RISK LEVEL DETERMINATION
-        # ================================================================
-        
-        if self.config['enable_quantum']:
-            # Quantum-aware risk levels
-            if risk_score >= 80:
-                risk_level = "Critical (HNDL)"
-                color = "red"
-            elif risk_score >= 60:
-                risk_level = "High - Quantum Vulnerable"
-                color = "orange"
-            elif risk_score >= 40:
-                risk_level = "Moderate"
-                color = "yellow"
-            else:
-                risk_level = "Low"
-                color = "blue"
-        else:
-            # Standard risk levels (no quantum terminology)
-            if risk_score >= 70:
-                risk_level = "High Risk"
-                color = "red"
-            elif risk_score >= 50:
-                risk_level = "Medium Risk"
-                color = "orange"
-            elif risk_score >= 30:
-                risk_level = "Low Risk"
-                color = "yellow"
-            else:
-                risk_level = "Minimal"
-                color = "blue"
-        
-        # ================================================================
-        # SOLUTION GENERATION
-        # ================================================================
-        
-        solution_parts = []
-        
-        if self.config['enable_quantum']:
-            if quantum_urgency in ['IMMEDIATE', 'URGENT']:
-                solution_parts.append(f"QUANTUM: Migrate to {pqc_migration}")
-            if not ssl_data.get('valid', False):
-                solution_parts.append("Deploy SSL/TLS")
-            if not ssl_data.get('quantum_safe', False):
-                solution_parts.append("Enable PQC hybrid mode")
-        else:
-            # Standard recon solutions
-            if not ssl_data.get('valid', False):
-                solution_parts.append("Deploy SSL certificate")
-            if criticality == 'CRITICAL':
-                solution_parts.append("Review access controls")
-        
-        if not solution_parts:
-            solution_parts.append("Continue monitoring")
-        
-        solution = " | ".join(solution_parts)
-        
-        # Generate asset fingerprint
-        asset_hash = hashlib.sha256(asset.encode()).hexdigest()[:12]
-        
         return {
             "asset": asset,
-            "asset_id": asset_hash,
+            "asset_id": asset_id,
             "ip": geo_data['ip'],
             "lat": geo_data['lat'],
             "lon": geo_data['lon'],
@@ -624,9 +827,8 @@ class SentinelAgent:
             "ssl_version": ssl_data.get('version', 'N/A'),
             "ssl_cipher": ssl_data.get('cipher', 'Unknown'),
             "quantum_safe_crypto": ssl_data.get('quantum_safe', False),
+            "geo_resolved": geo_data.get('resolved', False),
             "criticality": criticality,
-            "Quantum_Risk": risk_level,
-            "Risk_Score": risk_score,
             "quantum_threat_algorithm": quantum_threat_algorithm,
             "quantum_years_vulnerable": quantum_years_vulnerable,
             "quantum_urgency": quantum_urgency,
@@ -634,16 +836,24 @@ class SentinelAgent:
             "PQC_Signature": pqc_signature,
             "PQC_Priority": pqc_priority,
             "PQC_Timeline": pqc_timeline,
-            "Solution": solution,
-            "color": color,
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "harvest_now_threat": harvest_now_threat,
             "scan_mode": self.scan_mode
         }
 
 
+def pdf_bytes(pdf) -> bytes:
+    """Return a rendered FPDF document as bytes.
+    
+    fpdf2's output() returns the document as a bytearray, so there is no
+    intermediate latin-1 str to encode.
+    """
+    return bytes(pdf.output())
+
+
 def generate_pdf_report(df: pd.DataFrame, target: str, scan_mode: str = "Deep Quantum Analysis") -> bytes:
     """Enhanced PDF generation with scan mode info"""
+    from fpdf import FPDF
+    
     pdf = FPDF()
     pdf.add_page()
     
@@ -688,10 +898,13 @@ Sources: {', '.join(config['subdomain_sources'])}
     pdf.set_font("Arial", '', 10)
     
     total_assets = len(df)
-    critical_count = len(df[df['Quantum_Risk'].str.contains('Critical|High Risk', na=False)])
+    # Matches the 'Critical|High Risk' labels: Critical (HNDL) in quantum
+    # modes, High Risk in standard recon (which has no Critical label)
+    flagged = ('Critical',) if config['enable_quantum'] else ('Critical', 'High')
+    critical_count = int(df['risk_tier'].isin(flagged).sum())
     
     if config['enable_quantum']:
-        quantum_vulnerable = len(df[df['quantum_years_vulnerable'] <= 5])
+        quantum_vulnerable = int((df['quantum_years_vulnerable'].to_numpy() <= 5).sum())
         harvest_threat = len(df[df['harvest_now_threat'] == True])
         summary = f"""
 Scanned {total_assets} assets using {scan_mode}.
@@ -717,19 +930,25 @@ Note: Quantum analysis disabled in Standard Recon mode.
     pdf.set_text_color(0, 0, 0)
     pdf.set_font("Arial", '', 9)
     
-    for idx, row in df.iterrows():
+    # Every line of the asset list is formatted and made latin-1 safe
+    # column-wise up front; the loop below only emits cells
+    numbers = pd.Series(range(1, len(df) + 1), index=df.index).astype(str)
+    lines = pd.DataFrame({
+        'heading': numbers + ". " + df['asset'].astype(str),
+        'location': "   IP: " + df['ip'].astype(str) + " | " + df['city'].astype(str) + ", " + df['country'].astype(str),
+        'risk': "   Risk: " + df['Quantum_Risk'].astype(str) + " (Score: " + df['Risk_Score'].astype(str) + ")",
+        'action': "   Action: " + df['Solution'].astype(str).str[:60] + "...",
+    })
+    for col in lines.columns:
+        lines[col] = lines[col].str.encode('latin-1', 'replace').str.decode('latin-1')
+    
+    for idx, (heading, *details) in enumerate(lines.itertuples(index=False)):
         pdf.set_font("Arial", 'B', 10)
-        pdf.cell(0, 6, txt=f"{idx+1}. {row['asset']}", ln=True)
+        pdf.cell(0, 6, txt=heading, ln=True)
         pdf.set_font("Arial", '', 9)
         
-        details = [
-            f"   IP: {row['ip']} | {row['city']}, {row['country']}",
-            f"   Risk: {row['Quantum_Risk']} (Score: {row['Risk_Score']})",
-            f"   Action: {row['Solution'][:60]}..."
-        ]
-        
         for detail in details:
-            pdf.cell(0, 4, txt=detail.encode('latin-1', 'replace').decode('latin-1'), ln=True)
+            pdf.cell(0, 4, txt=detail, ln=True)
         pdf.ln(2)
         
         if (idx + 1) % 6 == 0 and idx < len(df) - 1:
@@ -741,7 +960,7 @@ Note: Quantum analysis disabled in Standard Recon mode.
     pdf.set_text_color(102, 51, 153)
     pdf.cell(0, 5, txt=f"Sentinel-V | {scan_mode} | ProSec Networks", ln=True, align='C')
     
-    return pdf.output(dest='S').encode('latin-1')
+    return pdf_bytes(pdf)
 
 
 async def run_audit(domain: str, scan_mode: str = "Deep Quantum Analysis", progress_callback: Optional[Callable] = None) -> pd.DataFrame:
@@ -755,6 +974,8 @@ async def run_audit(domain: str, scan_mode: str = "Deep Quantum Analysis", progr
     async with SentinelAgent(domain, scan_mode) as agent:
         assets = await agent.run_recon()
         intelligence_df = await agent.build_intelligence(assets, progress_callback)
+        # Tier counts travel with the frame, so views never rescan for them
+        intelligence_df.attrs['risk_counts'] = risk_counts(intelligence_df)
         
         print(f"\n{'='*60}")
         print(f"AUDIT COMPLETE")
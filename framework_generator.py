@@ -9,14 +9,17 @@ from typing import Dict, List
 import json
 from fpdf import FPDF
 from isms_templates import ISMSTemplates
+from core import pdf_bytes
 
 
 class ISMSFrameworkGenerator:
     """Autonomous ISMS framework generator for ProSec Networks"""
     
-    def __init__(self, scan_results: pd.DataFrame, target_domain: str):
+    def __init__(self, scan_results: pd.DataFrame, target_domain: str, quantum_enabled: bool = True):
         self.df = scan_results
         self.domain = target_domain
+        # Standard Recon scans carry no quantum estimates (0 years everywhere)
+        self.quantum_enabled = quantum_enabled
         self.industry = self._detect_industry()
         self.company_size = self._estimate_company_size()
         
@@ -48,8 +51,8 @@ class ISMSFrameworkGenerator:
     
     def generate_iso27001_soa(self) -> Dict:
         """Generate ISO 27001 Statement of Applicability"""
-        critical = len(self.df[self.df['Quantum_Risk'].str.contains('Critical', na=False)])
-        qv = len(self.df[self.df['quantum_years_vulnerable'] <= 5])
+        critical = int((self.df['risk_tier'] == 'Critical').sum())
+        qv = int((self.df['quantum_years_vulnerable'].to_numpy() <= 5).sum()) if self.quantum_enabled else 0
         
         controls = {
             'A.5 Information Security Policies': {
@@ -116,7 +119,7 @@ class ISMSFrameworkGenerator:
     
     def generate_nis2_compliance(self) -> Dict:
         """Generate NIS2 Article 21 compliance"""
-        critical = len(self.df[self.df['Quantum_Risk'].str.contains('Critical', na=False)])
+        critical = int((self.df['risk_tier'] == 'Critical').sum())
         
         requirements = {
             'Risk Management': {
@@ -294,4 +297,4 @@ def export_framework_pdf(framework: Dict, target: str) -> bytes:
     pdf.cell(0, 5, "Generated by Sentinel-V ISMS Framework Generator", ln=True, align='C')
     pdf.cell(0, 5, "ProSec Networks - Quantum-Ready Security Partner", ln=True, align='C')
     
-    return pdf.output(dest='S').encode('latin-1')
\ No newline at end of file
+    return pdf_bytes(pdf)
\ No newline at end of file
@@ -367,8 +367,9 @@ class ISMSTemplates:
         key = f"{industry}_{criticality.lower()}"
         
         # Fallback logic
-        if key in templates:
-            return templates[key]
+        template = templates.get(key)
+        if template is not None:
+            return template
         elif criticality.lower() == 'critical':
             return templates.get(f"{industry}_critical", templates['standard_high'])
         else:
@@ -528,8 +529,7 @@ class ISMSTemplates:
         }
         
         result = core_bausteine.copy()
-        if industry in industry_specific:
-            result.extend(industry_specific[industry])
+        result.extend(industry_specific.get(industry, ()))
         
         return result
     
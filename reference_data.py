@@ -0,0 +1,276 @@
+"""
+Sentinel-V Reference Data
+ISO 27001, BSI IT-Grundschutz and NIS2 Article 21 control catalogues,
+plus the static quantum threat tables shown in the UI
+"""
+
+import sys
+from types import MappingProxyType
+from typing import NamedTuple
+
+import pandas as pd
+
+
+# Enum-like record fields; their values are interned so equality checks such
+# as req['priority'] == 'P0' hit the identity fast path
+_ENUM_FIELDS = frozenset({'priority', 'status', 'quantum_impact'})
+
+
+class Control(NamedTuple):
+    """A single ISO 27001 Annex A control with its quantum annotations"""
+    id: str
+    name: str
+    description: str
+    quantum_impact: str
+    quantum_requirement: str
+    implementation: str
+
+
+def _freeze(obj):
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(obj, dict):
+        return MappingProxyType({
+            k: sys.intern(v) if k in _ENUM_FIELDS and isinstance(v, str) else _freeze(v)
+            for k, v in obj.items()
+        })
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+# ============================================================================
+# ISO 27001 CONTROLS DATABASE
+# ============================================================================
+
+ISO_27001_CONTROLS = {
+    "A.5": {
+        "name": "Information Security Policies",
+        "controls": [
+            {"id": "A.5.1", "name": "Policies for information security", 
+             "description": "A set of policies for information security shall be defined, approved by management, published and communicated to employees and relevant external parties.",
+             "quantum_impact": "HIGH",
+             "quantum_requirement": "Include Post-Quantum Cryptography (PQC) migration policy. Define timeline for transitioning to NIST-approved quantum-resistant algorithms.",
+             "implementation": "1. Draft quantum security policy\n2. Define PQC migration timeline\n3. Establish governance structure\n4. Communicate to all stakeholders"},
+        ]
+    },
+    "A.6": {
+        "name": "Organization of Information Security",
+        "controls": [
+            {"id": "A.6.1", "name": "Internal organization",
+             "description": "A management framework shall be established to initiate and control the implementation and operation of information security.",
+             "quantum_impact": "MEDIUM",
+             "quantum_requirement": "Assign quantum security responsibilities. Designate PQC migration lead.",
+             "implementation": "1. Appoint quantum security officer\n2. Define reporting structure\n3. Establish review cadence"},
+        ]
+    },
+    "A.8": {
+        "name": "Asset Management",
+        "controls": [
+            {"id": "A.8.1", "name": "Responsibility for assets",
+             "description": "Assets associated with information and information processing facilities shall be identified and an inventory maintained.",
+             "quantum_impact": "CRITICAL",
+             "quantum_requirement": "Maintain inventory of ALL cryptographic assets. Tag each with quantum vulnerability status and migration priority.",
+             "implementation": "1. Inventory all crypto assets\n2. Classify by quantum risk\n3. Tag migration priority\n4. Monitor continuously"},
+            {"id": "A.8.2", "name": "Information classification",
+             "description": "Information shall be classified in terms of legal requirements, value, criticality and sensitivity.",
+             "quantum_impact": "HIGH",
+             "quantum_requirement": "Add 'Quantum Sensitivity' classification. Data with >10yr confidentiality requirement needs immediate PQC.",
+             "implementation": "1. Add quantum classification tier\n2. Identify long-lived data\n3. Prioritize HNDL-vulnerable data"},
+        ]
+    },
+    "A.10": {
+        "name": "Cryptographic Controls",
+        "controls": [
+            {"id": "A.10.1", "name": "Cryptographic controls",
+             "description": "A policy on the use of cryptographic controls for protection of information shall be developed and implemented.",
+             "quantum_impact": "CRITICAL",
+             "quantum_requirement": "URGENT: Migrate to NIST PQC standards. Implement ML-KEM (FIPS 203) for key exchange, ML-DSA (FIPS 204) for signatures, SLH-DSA (FIPS 205) for stateless signatures.",
+             "implementation": "1. Audit current cryptography\n2. Select PQC algorithms\n3. Implement hybrid mode\n4. Test thoroughly\n5. Full migration"},
+        ]
+    },
+    "A.12": {
+        "name": "Operations Security",
+        "controls": [
+            {"id": "A.12.4", "name": "Logging and monitoring",
+             "description": "Event logs recording user activities, exceptions, faults and information security events shall be produced, kept and regularly reviewed.",
+             "quantum_impact": "HIGH",
+             "quantum_requirement": "Monitor for quantum-related threats. Detect potential HNDL (Harvest Now, Decrypt Later) attacks - unusual data exfiltration patterns.",
+             "implementation": "1. Add quantum threat signatures to SIEM\n2. Monitor large data transfers\n3. Alert on crypto anomalies"},
+        ]
+    },
+    "A.13": {
+        "name": "Communications Security",
+        "controls": [
+            {"id": "A.13.1", "name": "Network security management",
+             "description": "Networks shall be managed and controlled to protect information in systems and applications.",
+             "quantum_impact": "CRITICAL",
+             "quantum_requirement": "Deploy quantum-safe TLS. Implement hybrid classical-PQC cipher suites during transition.",
+             "implementation": "1. Upgrade TLS libraries\n2. Enable PQC cipher suites\n3. Test interoperability\n4. Monitor performance"},
+        ]
+    },
+    "A.14": {
+        "name": "System Development Security",
+        "controls": [
+            {"id": "A.14.2", "name": "Security in development processes",
+             "description": "Rules for the development of software and systems shall be established and applied.",
+             "quantum_impact": "HIGH",
+             "quantum_requirement": "Integrate cryptographic agility into SDL. All new systems must support algorithm switching without code changes.",
+             "implementation": "1. Update coding standards\n2. Require crypto abstraction layers\n3. Add PQC to security testing"},
+        ]
+    },
+    "A.16": {
+        "name": "Incident Management",
+        "controls": [
+            {"id": "A.16.1", "name": "Management of incidents",
+             "description": "Responsibilities and procedures shall be established to ensure a quick, effective and orderly response to incidents.",
+             "quantum_impact": "HIGH",
+             "quantum_requirement": "Develop quantum incident response playbooks. Define procedures for discovered HNDL attacks and crypto compromises.",
+             "implementation": "1. Create quantum IR playbook\n2. Define escalation paths\n3. Establish notification procedures\n4. Practice tabletop exercises"},
+        ]
+    },
+    "A.18": {
+        "name": "Compliance",
+        "controls": [
+            {"id": "A.18.1", "name": "Compliance with legal requirements",
+             "description": "All relevant statutory, regulatory and contractual requirements shall be identified, documented and kept up to date.",
+             "quantum_impact": "CRITICAL",
+             "quantum_requirement": "Monitor quantum-related regulations. NIS2 (EU), NIST guidelines (US), BSI recommendations (DE) all increasingly require quantum readiness.",
+             "implementation": "1. Track regulatory developments\n2. Map to compliance calendar\n3. Ensure audit readiness"},
+        ]
+    }
+}
+
+# ============================================================================
+# BSI IT-GRUNDSCHUTZ DATABASE
+# ============================================================================
+
+BSI_BAUSTEINE = {
+    "ISMS": [
+        {"id": "ISMS.1", "name": "Sicherheitsmanagement",
+         "description": "Establishes the foundation for information security management system.",
+         "quantum_req": "Integrate quantum risk into enterprise risk management. Assign quantum security responsibilities.",
+         "priority": "P0"},
+    ],
+    "CON": [
+        {"id": "CON.1", "name": "Kryptokonzept",
+         "description": "Cryptographic concept defining all cryptographic mechanisms used.",
+         "quantum_req": "CRITICAL: Define PQC transition strategy. Document current crypto inventory. Plan migration to ML-KEM (FIPS 203), ML-DSA (FIPS 204), SLH-DSA (FIPS 205).",
+         "priority": "P0"},
+        {"id": "CON.7", "name": "Informationssicherheit auf Reisen",
+         "description": "Security for mobile work and travel.",
+         "quantum_req": "Ensure VPN uses quantum-safe protocols. Protect mobile devices with PQC-enabled encryption.",
+         "priority": "P1"},
+    ],
+    "OPS": [
+        {"id": "OPS.1.1.2", "name": "Ordnungsgemäße IT-Administration",
+         "description": "Proper IT administration procedures.",
+         "quantum_req": "Include PQC updates in patch management. Prioritize crypto library updates.",
+         "priority": "P1"},
+        {"id": "OPS.1.1.3", "name": "Patch- und Änderungsmanagement",
+         "description": "Patch and change management.",
+         "quantum_req": "Establish expedited patching for quantum-related vulnerabilities. Track NIST PQC updates.",
+         "priority": "P0"},
+    ],
+    "DER": [
+        {"id": "DER.1", "name": "Detektion von sicherheitsrelevanten Ereignissen",
+         "description": "Detection of security-relevant events.",
+         "quantum_req": "Add HNDL attack signatures to detection rules. Monitor for unusual encrypted data exfiltration.",
+         "priority": "P0"},
+        {"id": "DER.2.1", "name": "Behandlung von Sicherheitsvorfällen",
+         "description": "Security incident handling.",
+         "quantum_req": "Develop quantum-specific incident response procedures. Include crypto compromise scenarios.",
+         "priority": "P0"},
+    ],
+    "NET": [
+        {"id": "NET.1.1", "name": "Netzarchitektur und -design",
+         "description": "Network architecture and design.",
+         "quantum_req": "Design for cryptographic agility. Enable seamless algorithm transitions.",
+         "priority": "P1"},
+        {"id": "NET.3.3", "name": "VPN",
+         "description": "Virtual Private Networks.",
+         "quantum_req": "CRITICAL: Deploy quantum-safe VPN. Implement hybrid classical-PQC mode immediately.",
+         "priority": "P0"},
+    ]
+}
+
+# ============================================================================
+# NIS2 ARTICLE 21 DATABASE
+# ============================================================================
+
+NIS2_REQUIREMENTS = [
+    {"article": "21(2)(a)", "name": "Risk analysis and security policies",
+     "description": "Policies on risk analysis and information system security.",
+     "quantum_gap": "Must include quantum computing in risk analysis. PQC migration policy required.",
+     "status": "CRITICAL", "priority": "P0"},
+    {"article": "21(2)(b)", "name": "Incident handling",
+     "description": "Procedures for handling security incidents.",
+     "quantum_gap": "Quantum incident response procedures needed. HNDL attack playbook required.",
+     "status": "REQUIRED", "priority": "P0"},
+    {"article": "21(2)(c)", "name": "Business continuity",
+     "description": "Business continuity including backup management, disaster recovery, and crisis management.",
+     "quantum_gap": "Include quantum threats in BCM scenarios. Crypto-apocalypse scenario planning.",
+     "status": "REQUIRED", "priority": "P1"},
+    {"article": "21(2)(d)", "name": "Supply chain security",
+     "description": "Security relating to acquisition, development and maintenance of systems.",
+     "quantum_gap": "Assess supplier quantum readiness. Include PQC requirements in procurement.",
+     "status": "REQUIRED", "priority": "P1"},
+    {"article": "21(2)(e)", "name": "Security in network and systems acquisition",
+     "description": "Security in network and information systems acquisition, development and maintenance.",
+     "quantum_gap": "Mandate cryptographic agility in new systems. Require PQC capability.",
+     "status": "REQUIRED", "priority": "P1"},
+    {"article": "21(2)(f)", "name": "Vulnerability handling and disclosure",
+     "description": "Policies and procedures for assessing effectiveness of cybersecurity measures.",
+     "quantum_gap": "Include quantum vulnerabilities in assessment scope. Track CVEs related to crypto.",
+     "status": "CRITICAL", "priority": "P0"},
+    {"article": "21(2)(g)", "name": "Cybersecurity training",
+     "description": "Basic cyber hygiene practices and cybersecurity training.",
+     "quantum_gap": "Add quantum awareness training. Educate staff on HNDL threats.",
+     "status": "RECOMMENDED", "priority": "P2"},
+    {"article": "21(2)(h)", "name": "Cryptography",
+     "description": "Policies and procedures regarding the use of cryptography and encryption.",
+     "quantum_gap": "CRITICAL: Explicit PQC migration plan required. NIST FIPS 203/204/205 implementation.",
+     "status": "CRITICAL", "priority": "P0"},
+    {"article": "21(2)(i)", "name": "Human resources security",
+     "description": "Human resources security, access control policies and asset management.",
+     "quantum_gap": "Include quantum in security awareness. Update access controls for PQC.",
+     "status": "REQUIRED", "priority": "P1"},
+    {"article": "21(2)(j)", "name": "Multi-factor authentication",
+     "description": "Use of MFA, secured communications and emergency communication systems.",
+     "quantum_gap": "Plan for quantum-safe MFA. Current TOTP/HOTP may need updates.",
+     "status": "REQUIRED", "priority": "P1"},
+]
+
+# ============================================================================
+# FROZEN CATALOGUES
+# ============================================================================
+
+# Imported modules outlive Streamlit reruns, so these are built once per
+# process and shared read-only across sessions
+ISO_27001_CONTROLS = MappingProxyType({
+    domain_id: MappingProxyType({
+        'name': domain['name'],
+        'controls': tuple(Control(**c) for c in domain['controls']),
+    })
+    for domain_id, domain in _freeze(ISO_27001_CONTROLS).items()
+})
+BSI_BAUSTEINE = _freeze(BSI_BAUSTEINE)
+NIS2_REQUIREMENTS = _freeze(NIS2_REQUIREMENTS)
+
+# ============================================================================
+# QUANTUM THREAT TABLES
+# ============================================================================
+
+QUBIT_REQUIREMENTS_DF = pd.DataFrame({
+    "Algorithm": ["RSA-2048", "RSA-4096", "ECC-256", "ECC-384"],
+    "Logical Qubits": ["4,099", "8,194", "2,330", "3,484"],
+    "Physical Qubits*": ["~20M", "~40M", "~12M", "~17M"],
+    "Est. Break Time": ["8 hours", "24 hours", "4 hours", "8 hours"]
+})
+
+# Grover halves the effective key length of symmetric ciphers
+AES_GROVER_DF = pd.DataFrame({
+    "Algorithm": ["AES-128", "AES-192", "AES-256"],
+    "Classical Security": ["128 bits", "192 bits", "256 bits"],
+    "Post-Quantum Security": ["64 bits ❌", "96 bits ⚠️", "128 bits ✅"],
+    "Status": ["INSECURE", "MARGINAL", "SECURE"],
+}).set_index("Algorithm")